@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 from datetime import datetime
 
 from sqlalchemy.orm import Session
@@ -11,6 +12,7 @@ from app.agents.signal import generate_signals
 from app.config import get_settings
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 
 def process_article(article: Article, db: Session) -> list[Signal]:
@@ -18,9 +20,9 @@ def process_article(article: Article, db: Session) -> list[Signal]:
     content = article.summary or article.content or article.title
 
     # Step 1: Entity extraction
-    print(f"  [Entity] Processing: {article.title[:60]}...")
+    logger.debug("[Entity] Processing: %.60s...", article.title)
     entities = extract_entities(article.title, content)
-    print(f"  [Entity] Found {len(entities)} entities")
+    logger.debug("[Entity] Found %d entities", len(entities))
 
     if not entities:
         # Mark as processed even if no entities found
@@ -29,14 +31,14 @@ def process_article(article: Article, db: Session) -> list[Signal]:
         return []
 
     # Step 2: Sentiment analysis
-    print(f"  [Sentiment] Analyzing...")
+    logger.debug("[Sentiment] Analyzing...")
     sentiment = analyze_sentiment(article.title, content, entities)
-    print(f"  [Sentiment] Result: {sentiment.get('sentiment')} ({sentiment.get('confidence')})")
+    logger.debug("[Sentiment] Result: %s (%s)", sentiment.get("sentiment"), sentiment.get("confidence"))
 
     # Step 3: Signal generation
-    print(f"  [Signal] Generating signals...")
+    logger.debug("[Signal] Generating signals...")
     raw_signals = generate_signals(article.title, content, entities, sentiment)
-    print(f"  [Signal] Generated {len(raw_signals)} signals")
+    logger.debug("[Signal] Generated %d signals", len(raw_signals))
 
     # Store signals in database
     db_signals = []
@@ -72,12 +74,12 @@ def process_unprocessed_articles(db: Session, limit: int = 20) -> dict:
 
     total_signals = 0
     for i, article in enumerate(articles):
-        print(f"\n[{i+1}/{len(articles)}] Processing article: {article.title[:80]}")
+        logger.info("[%d/%d] Processing article: %.80s", i + 1, len(articles), article.title)
         try:
             signals = process_article(article, db)
             total_signals += len(signals)
         except Exception as e:
-            print(f"  [Error] Failed to process article {article.id}: {e}")
+            logger.warning("Failed to process article %s: %s", article.id, e)
             article.processed = True  # Skip on error
             db.commit()
 
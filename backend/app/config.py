@@ -114,6 +114,9 @@ class Settings(BaseSettings):
     scraping_delay: float = 1.0
     scraping_max_retries: int = 3
 
+    # Logging
+    log_level: str = "INFO"
+
     # News sources (web scraping)
     news_sources: dict[str, str] = {
         "Globe and Mail": "https://www.theglobeandmail.com/business/",
@@ -1,5 +1,6 @@
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, sessionmaker, DeclarativeBase
 
 from app.config import get_settings
 
@@ -10,10 +11,17 @@ connect_args = {}
 if settings.database_url.startswith("sqlite"):
     connect_args["check_same_thread"] = False
 
+# Threaded ingestion checks out one session per worker; size the pool for that
+pool_args = {}
+if not settings.database_url.startswith("sqlite"):
+    pool_args = dict(pool_size=10, max_overflow=20, pool_timeout=30, pool_pre_ping=True, pool_recycle=1800)
+
 engine = create_engine(
     settings.database_url,
     connect_args=connect_args,
     echo=False,
+    insertmanyvalues_page_size=1000,  # Rows per multi-VALUES INSERT for bulk writes
+    **pool_args,
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -31,5 +39,12 @@ def get_db():
         db.close()
 
 
+def dialect_insert(db: Session, table):
+    """INSERT for the session's dialect, so callers can use on_conflict_do_nothing / _do_update."""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(table)
+    return sqlite.insert(table)
+
+
 def init_db():
     Base.metadata.create_all(bind=engine)
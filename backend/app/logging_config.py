@@ -0,0 +1,39 @@
+"""
+Non-blocking logging setup.
+
+Log calls on hot paths only enqueue the record; a background QueueListener
+thread does the formatting and the (potentially blocking) stream write.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+
+from app.config import get_settings
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def configure_logging() -> None:
+    """Route the root logger through a queue to a stdout writer thread (idempotent)."""
+    global _listener
+    if _listener is not None:
+        return
+
+    settings = get_settings()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(settings.log_level.upper())
@@ -4,6 +4,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.database import init_db
+from app.logging_config import configure_logging
 from app.routers import (
     news, signals, backtest, dashboard, themes, stocks, sentiment,
     stock_detail, search, chat, sources, insights,
@@ -57,6 +58,7 @@ app.include_router(reports.router)
 
 @app.on_event("startup")
 def startup():
+    configure_logging()
     init_db()
 
     # Populate Top 100 stock universe + initial quote fetch if empty
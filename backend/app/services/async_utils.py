@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, TypeVar
+
+T = TypeVar("T")
+
+
+def run_sync(coro: Awaitable[T]) -> T:
+    """
+    Run a coroutine to completion from sync code and return its result.
+
+    asyncio.run() refuses to start when the calling thread already has a running
+    loop (e.g. sync FastAPI startup hooks run on the event-loop thread), so in
+    that case the coroutine gets its own loop on a short-lived worker thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
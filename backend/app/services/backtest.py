@@ -1,121 +1,210 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+import logging
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import yfinance as yf
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.models import Signal, BacktestResult
 
+logger = logging.getLogger(__name__)
+
+# Back-test rows accumulated before each INSERT + commit
+INSERT_BATCH_SIZE = 500
+
+
+class _NoPriceHistory(LookupError):
+    """Raised instead of returning an empty window so lru_cache doesn't keep it."""
+
+
+@lru_cache(maxsize=1024)
+def _cached_prices(ticker: str, start_day: date, end_day: date) -> Tuple[Tuple[str, float], ...]:
+    """
+    Memoized yfinance fetch; returns an immutable (date, close) tuple so cache entries can't be mutated.
+
+    lru_cache only stores returned values, so empty windows raise _NoPriceHistory
+    (and fetch errors propagate) to be retried on the next call.
+    """
+    stock = yf.Ticker(ticker)
+    hist = stock.history(
+        start=start_day.strftime("%Y-%m-%d"),
+        end=end_day.strftime("%Y-%m-%d"),
+    )
+    if hist.empty:
+        raise _NoPriceHistory(ticker)
+    return tuple((d.strftime("%Y-%m-%d"), float(close)) for d, close in hist["Close"].items())
+
+
+def clear_price_cache() -> None:
+    """Drop memoized price windows (call at the start of each scheduled run)."""
+    _cached_prices.cache_clear()
+
 
 def get_stock_prices(ticker: str, start_date: datetime, end_date: datetime) -> Dict[str, float]:
-    """Fetch historical stock prices for a ticker using yfinance."""
+    """Fetch historical stock prices for a ticker using yfinance (memoized per day window)."""
     try:
-        stock = yf.Ticker(ticker)
-        hist = stock.history(
-            start=start_date.strftime("%Y-%m-%d"),
-            end=end_date.strftime("%Y-%m-%d"),
-        )
-        if hist.empty:
-            return {}
         # Return date -> close price mapping
-        return {d.strftime("%Y-%m-%d"): float(row["Close"]) for d, row in hist.iterrows()}
+        return dict(_cached_prices(ticker, start_date.date(), end_date.date()))
+    except _NoPriceHistory:
+        return {}
     except Exception as e:
-        print(f"Error fetching prices for {ticker}: {e}")
+        logger.warning("Error fetching prices for %s: %s", ticker, e)
         return {}
 
 
-def find_nearest_price(prices: Dict[str, float], target_date: datetime, max_days_offset: int = 5) -> Optional[float]:
-    """Find the closest available price to a target date (handles weekends/holidays)."""
-    for offset in range(max_days_offset + 1):
-        for direction in [0, 1, -1, 2, -2, 3, -3, 4, -4, 5, -5]:
-            check_date = (target_date + timedelta(days=direction + offset)).strftime("%Y-%m-%d")
-            if check_date in prices:
-                return prices[check_date]
-        check_date = (target_date + timedelta(days=offset)).strftime("%Y-%m-%d")
-        if check_date in prices:
-            return prices[check_date]
-    return None
+def _nearest_prices(dates: np.ndarray, closes: np.ndarray, targets: np.ndarray,
+                    max_days_offset: int = 5) -> np.ndarray:
+    """
+    Closest trading-day close for each target date (handles weekends/holidays).
+
+    The nearest close within max_days_offset days (ties prefer the later date);
+    failing that, the first close up to 2 * max_days_offset days after the
+    target. Anything else gets NaN.
+    """
+    never = np.iinfo(np.int64).max
+    idx = np.searchsorted(dates, targets)
+    has_right = idx < len(dates)
+    right = np.minimum(idx, len(dates) - 1)
+    left = np.maximum(idx - 1, 0)
+    dist_right = np.where(has_right, (dates[right] - targets).astype(np.int64), never)
+    dist_left = np.where(idx > 0, (targets - dates[left]).astype(np.int64), never)
+    pick = np.where(dist_left < dist_right, left, right)
 
+    nearest = np.minimum(dist_left, dist_right) <= max_days_offset
+    forward = ~nearest & (dist_right <= 2 * max_days_offset)
+    return np.where(nearest, closes[pick], np.where(forward, closes[right], np.nan))
 
-def backtest_signal(signal: Signal, db: Session) -> Optional[BacktestResult]:
-    """Back-test a single signal against actual market data."""
-    signal_date = signal.created_at or datetime.utcnow()
-    ticker = signal.stock_ticker
 
-    if not ticker or not signal.direction:
-        return None
+def _round_or_none(value: float, ndigits: int = 2) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), ndigits)
 
-    # Fetch prices from signal date to 35 days later
-    start = signal_date - timedelta(days=5)
-    end = signal_date + timedelta(days=35)
+
+def backtest_ticker_signals(ticker: str, signals: List[Signal]) -> List[dict]:
+    """
+    Back-test all signals for one ticker against a single price fetch.
+
+    Returns BacktestResult column mappings ready for bulk insert.
+    """
+    now = datetime.utcnow()
+    signal_datetimes = [s.created_at or now for s in signals]
+
+    # One price window covering every signal: earliest - 5d .. latest + 35d
+    start = min(signal_datetimes) - timedelta(days=5)
+    end = max(signal_datetimes) + timedelta(days=35)
     prices = get_stock_prices(ticker, start, end)
 
     if not prices:
-        print(f"  No price data for {ticker}")
-        return None
-
-    # Get prices at signal date, +1d, +7d, +30d
-    price_at_signal = find_nearest_price(prices, signal_date)
-    price_1d = find_nearest_price(prices, signal_date + timedelta(days=1))
-    price_7d = find_nearest_price(prices, signal_date + timedelta(days=7))
-    price_30d = find_nearest_price(prices, signal_date + timedelta(days=30))
-
-    if price_at_signal is None:
-        return None
-
-    # Calculate changes
-    change_1d = ((price_1d - price_at_signal) / price_at_signal * 100) if price_1d else None
-    change_7d = ((price_7d - price_at_signal) / price_at_signal * 100) if price_7d else None
-    change_30d = ((price_30d - price_at_signal) / price_at_signal * 100) if price_30d else None
-
-    # Determine accuracy (did the stock move in the predicted direction?)
-    predicted_up = signal.direction.lower() == "up"
-    accurate_1d = (change_1d > 0) == predicted_up if change_1d is not None else None
-    accurate_7d = (change_7d > 0) == predicted_up if change_7d is not None else None
-    accurate_30d = (change_30d > 0) == predicted_up if change_30d is not None else None
-
-    result = BacktestResult(
-        signal_id=signal.id,
-        ticker=ticker,
-        signal_date=signal_date,
-        direction_predicted=signal.direction,
-        price_at_signal=round(price_at_signal, 2),
-        price_1d=round(price_1d, 2) if price_1d else None,
-        price_7d=round(price_7d, 2) if price_7d else None,
-        price_30d=round(price_30d, 2) if price_30d else None,
-        actual_1d_change=round(change_1d, 2) if change_1d is not None else None,
-        actual_7d_change=round(change_7d, 2) if change_7d is not None else None,
-        actual_30d_change=round(change_30d, 2) if change_30d is not None else None,
-        accurate_1d=accurate_1d,
-        accurate_7d=accurate_7d,
-        accurate_30d=accurate_30d,
-    )
-    db.add(result)
-    db.commit()
-    return result
+        logger.info("No price data for %s", ticker)
+        return []
+
+    dates = np.array(sorted(prices), dtype="datetime64[D]")
+    closes = np.array([prices[d] for d in sorted(prices)], dtype=np.float64)
+    signal_days = np.array([d.date() for d in signal_datetimes], dtype="datetime64[D]")
+
+    # Prices at signal date, +1d, +7d, +30d
+    price_at_signal = _nearest_prices(dates, closes, signal_days)
+    price_1d = _nearest_prices(dates, closes, signal_days + np.timedelta64(1, "D"))
+    price_7d = _nearest_prices(dates, closes, signal_days + np.timedelta64(7, "D"))
+    price_30d = _nearest_prices(dates, closes, signal_days + np.timedelta64(30, "D"))
+
+    # Percentage changes (NaN propagates where a price is missing)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        change_1d = (price_1d - price_at_signal) / price_at_signal * 100
+        change_7d = (price_7d - price_at_signal) / price_at_signal * 100
+        change_30d = (price_30d - price_at_signal) / price_at_signal * 100
+
+        # Did the stock move in the predicted direction?
+        predicted_up = np.array([s.direction.lower() == "up" for s in signals])
+        accurate_1d = (change_1d > 0) == predicted_up
+        accurate_7d = (change_7d > 0) == predicted_up
+        accurate_30d = (change_30d > 0) == predicted_up
+
+    rows = []
+    for i, signal in enumerate(signals):
+        if np.isnan(price_at_signal[i]):
+            continue
+        rows.append({
+            "signal_id": signal.id,
+            "ticker": ticker,
+            "signal_date": signal_datetimes[i],
+            "direction_predicted": signal.direction,
+            "price_at_signal": _round_or_none(price_at_signal[i]),
+            "price_1d": _round_or_none(price_1d[i]),
+            "price_7d": _round_or_none(price_7d[i]),
+            "price_30d": _round_or_none(price_30d[i]),
+            "actual_1d_change": _round_or_none(change_1d[i]),
+            "actual_7d_change": _round_or_none(change_7d[i]),
+            "actual_30d_change": _round_or_none(change_30d[i]),
+            "accurate_1d": None if np.isnan(change_1d[i]) else bool(accurate_1d[i]),
+            "accurate_7d": None if np.isnan(change_7d[i]) else bool(accurate_7d[i]),
+            "accurate_30d": None if np.isnan(change_30d[i]) else bool(accurate_30d[i]),
+            "created_at": now,
+        })
+    return rows
+
+
+def _insert_results(db: Session, rows: List[dict]) -> int:
+    """
+    Write a batch of result mappings as one multi-row INSERT and commit.
+
+    If the batch fails it is rolled back and retried row by row, so one bad
+    result only loses itself; returns the number of rows stored.
+    """
+    try:
+        db.execute(insert(BacktestResult), rows)
+        db.commit()
+        return len(rows)
+    except Exception as e:
+        db.rollback()
+        logger.warning("Back-test batch of %d results failed, storing individually: %s", len(rows), e)
+
+    created = 0
+    for row in rows:
+        try:
+            db.execute(insert(BacktestResult), [row])
+            db.commit()
+            created += 1
+        except Exception as e:
+            db.rollback()
+            logger.warning("Failed to store back-test result for signal %s: %s", row.get("signal_id"), e)
+    return created
 
 
 def run_backtest_for_unvalidated(db: Session) -> dict:
     """Run back-tests for all signals that haven't been validated yet."""
-    # Find signals without backtest results
-    tested_signal_ids = [r[0] for r in db.query(BacktestResult.signal_id).all()]
+    # Find signals without backtest results (anti-join evaluated by the database)
+    has_result = db.query(BacktestResult.id).filter(BacktestResult.signal_id == Signal.id).exists()
     untested = db.query(Signal).filter(
-        Signal.id.notin_(tested_signal_ids) if tested_signal_ids else True,
+        ~has_result,
         Signal.direction.isnot(None),
     ).all()
 
+    # Group by ticker so each ticker's prices are fetched once and computed in one pass
+    by_ticker: Dict[str, List[Signal]] = defaultdict(list)
+    for signal in untested:
+        if signal.stock_ticker:
+            by_ticker[signal.stock_ticker].append(signal)
+
+    pending: List[dict] = []
     results_created = 0
-    for i, signal in enumerate(untested):
-        print(f"  [{i+1}/{len(untested)}] Back-testing {signal.stock_ticker} (signal {signal.id})...")
+    for i, (ticker, signals) in enumerate(by_ticker.items()):
+        logger.info("[%d/%d] Back-testing %s (%d signals)...", i + 1, len(by_ticker), ticker, len(signals))
         try:
-            result = backtest_signal(signal, db)
-            if result:
-                results_created += 1
-                acc_str = f"1d:{result.accurate_1d}, 7d:{result.accurate_7d}, 30d:{result.accurate_30d}"
-                print(f"    Result: {acc_str}")
+            pending.extend(backtest_ticker_signals(ticker, signals))
         except Exception as e:
-            print(f"    Error: {e}")
+            logger.warning("Back-test failed for %s: %s", ticker, e)
+
+        if len(pending) >= INSERT_BATCH_SIZE:
+            results_created += _insert_results(db, pending)
+            pending = []
+
+    if pending:
+        results_created += _insert_results(db, pending)
 
     return {"signals_tested": len(untested), "results_created": results_created}
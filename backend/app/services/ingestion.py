@@ -1,17 +1,23 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import logging
 from datetime import datetime
 from time import mktime
 
 import feedparser
+import httpx
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
 from app.models import Article
+from app.services.async_utils import run_sync
 
 settings = get_settings()
 
+logger = logging.getLogger(__name__)
+
 
 def hash_url(url: str) -> str:
     return hashlib.sha256(url.encode()).hexdigest()
@@ -25,11 +31,10 @@ def parse_published_date(entry) -> datetime | None:
     return None
 
 
-def ingest_feed(source_name: str, feed_url: str, db: Session) -> list[Article]:
-    """Fetch and store articles from a single RSS feed."""
+def _store_feed_entries(source_name: str, feed, db: Session) -> list[Article]:
+    """Persist new entries of an already-parsed feed."""
     new_articles = []
     try:
-        feed = feedparser.parse(feed_url)
         for entry in feed.entries:
             url = entry.get("link", "")
             if not url:
@@ -63,16 +68,49 @@ def ingest_feed(source_name: str, feed_url: str, db: Session) -> list[Article]:
         db.commit()
     except Exception as e:
         db.rollback()
-        print(f"Error ingesting {source_name}: {e}")
+        logger.warning("Error ingesting %s: %s", source_name, e)
 
     return new_articles
 
 
+def ingest_feed(source_name: str, feed_url: str, db: Session) -> list[Article]:
+    """Fetch and store articles from a single RSS feed."""
+    try:
+        feed = feedparser.parse(feed_url)
+    except Exception as e:
+        logger.warning("Error ingesting %s: %s", source_name, e)
+        return []
+    return _store_feed_entries(source_name, feed, db)
+
+
+async def _fetch_feed_bodies(feed_urls: list[str]) -> list:
+    """Download all feeds concurrently; returns raw bodies (or the exception per feed)."""
+    async def fetch(client: httpx.AsyncClient, url: str) -> bytes:
+        response = await client.get(url)
+        response.raise_for_status()
+        return response.content
+
+    async with httpx.AsyncClient(
+        timeout=30,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=16),
+        headers={"User-Agent": feedparser.USER_AGENT},
+    ) as client:
+        return await asyncio.gather(*(fetch(client, url) for url in feed_urls), return_exceptions=True)
+
+
 def ingest_all_feeds(db: Session) -> dict:
-    """Ingest from all configured RSS feeds."""
+    """Ingest from all configured RSS feeds (fetched concurrently, parsed from the downloaded bytes)."""
+    sources = list(settings.rss_feeds.items())
+    bodies = run_sync(_fetch_feed_bodies([feed_url for _, feed_url in sources]))
+
     results = {}
-    for source_name, feed_url in settings.rss_feeds.items():
-        articles = ingest_feed(source_name, feed_url, db)
+    for (source_name, _), body in zip(sources, bodies):
+        if isinstance(body, Exception):
+            logger.warning("Error fetching %s: %s", source_name, body)
+            results[source_name] = 0
+            continue
+        articles = _store_feed_entries(source_name, feedparser.parse(body), db)
         results[source_name] = len(articles)
-        print(f"Ingested {len(articles)} new articles from {source_name}")
+        logger.info("Ingested %d new articles from %s", len(articles), source_name)
     return results
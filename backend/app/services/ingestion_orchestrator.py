@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import List, Dict
 
 from sqlalchemy.orm import Session
 
-from app.models import Article, StockQuote, SentimentData
+from app.database import SessionLocal
+from app.models import Article
 from app.services.scrapers.news_scrapers import (
     GlobeAndMailScraper,
     BNNBloombergScraper,
@@ -19,6 +22,8 @@ from app.services.scrapers.news_scrapers import (
 from app.services.scrapers.stock_scrapers import YFinanceStockScraper
 from app.services.scrapers.sentiment_scrapers import RedditScraper, TwitterScraper
 
+logger = logging.getLogger(__name__)
+
 
 class IngestionOrchestrator:
     """
@@ -44,55 +49,64 @@ class IngestionOrchestrator:
         self.twitter_scraper = TwitterScraper()
 
     def ingest_all_news(self, db: Session, limit_per_source: int = 20) -> Dict[str, int]:
-        """Scrape all news sources and save to database."""
-        print(f"\n{'='*60}")
-        print(f"NEWS INGESTION - {datetime.utcnow().isoformat()}")
-        print(f"{'='*60}\n")
+        """
+        Scrape all news sources and save to database.
+
+        Sources are independent and I/O-bound, so they are scraped concurrently
+        (each with its own session for the dedup lookup); saving stays on db.
+        """
+        logger.info("NEWS INGESTION - %s", datetime.utcnow().isoformat())
 
         results = {}
         total_articles = 0
 
-        for scraper in self.news_scrapers:
-            try:
-                articles = scraper.scrape(limit=limit_per_source, db=db)
-
-                # Save to database
-                for article in articles:
-                    try:
-                        db.add(article)
-                        db.commit()
-                        total_articles += 1
-                    except Exception:
-                        db.rollback()  # Skip duplicates
-
-                results[scraper.source_name] = len(articles)
-            except Exception as e:
-                print(f"Error with {scraper.source_name}: {e}")
-                results[scraper.source_name] = 0
-                db.rollback()
-
-        print(f"\nNews ingestion complete: {total_articles} new articles from {len(results)} sources")
+        with ThreadPoolExecutor(max_workers=len(self.news_scrapers)) as executor:
+            futures = {
+                executor.submit(self.run_in_session, self._scrape_source, scraper, limit_per_source): scraper
+                for scraper in self.news_scrapers
+            }
+            for future in as_completed(futures):
+                scraper = futures[future]
+                try:
+                    articles = future.result()
+
+                    # Save to database
+                    for article in articles:
+                        try:
+                            db.add(article)
+                            db.commit()
+                            total_articles += 1
+                        except Exception:
+                            db.rollback()  # Skip duplicates
+
+                    results[scraper.source_name] = len(articles)
+                except Exception as e:
+                    logger.warning("Error with %s: %s", scraper.source_name, e)
+                    results[scraper.source_name] = 0
+                    db.rollback()
+
+        logger.info("News ingestion complete: %d new articles from %d sources", total_articles, len(results))
         return results
 
+    @staticmethod
+    def _scrape_source(db: Session, scraper, limit: int) -> List[Article]:
+        return scraper.scrape(limit=limit, db=db)
+
     def update_stock_quotes(self, db: Session, tickers: List[str] = None) -> int:
         """Update stock quotes for given tickers or all TSX stocks."""
-        print(f"\n{'='*60}")
-        print(f"STOCK QUOTE UPDATE - {datetime.utcnow().isoformat()}")
-        print(f"{'='*60}\n")
+        logger.info("STOCK QUOTE UPDATE - %s", datetime.utcnow().isoformat())
 
         if tickers:
             quotes = self.stock_scraper.fetch_quotes_batch(tickers, db=db)
         else:
             quotes = self.stock_scraper.fetch_top_tsx_quotes(db=db)
 
-        print(f"Stock update complete: {len(quotes)} quotes updated")
+        logger.info("Stock update complete: %d quotes updated", len(quotes))
         return len(quotes)
 
     def ingest_sentiment(self, db: Session, limit: int = 25) -> int:
         """Scrape Reddit and Twitter sentiment data."""
-        print(f"\n{'='*60}")
-        print(f"SENTIMENT INGESTION - {datetime.utcnow().isoformat()}")
-        print(f"{'='*60}\n")
+        logger.info("SENTIMENT INGESTION - %s", datetime.utcnow().isoformat())
 
         # Reddit
         reddit_posts = self.sentiment_scraper.scrape_all(limit=limit, db=db)
@@ -101,37 +115,60 @@ class IngestionOrchestrator:
         twitter_posts = self.twitter_scraper.scrape_all(limit=limit, db=db)
 
         total = len(reddit_posts) + len(twitter_posts)
-        print(f"Sentiment ingestion complete: {total} posts "
-              f"({len(reddit_posts)} Reddit, {len(twitter_posts)} Twitter)")
+        logger.info(
+            "Sentiment ingestion complete: %d posts (%d Reddit, %d Twitter)",
+            total, len(reddit_posts), len(twitter_posts),
+        )
         return total
 
+    @staticmethod
+    def run_in_session(stage, *args, **kwargs):
+        """Run a stage with its own DB session (sessions are not thread-safe)."""
+        db = SessionLocal()
+        try:
+            return stage(db, *args, **kwargs)
+        finally:
+            db.close()
+
     def run_full_ingestion(self, db: Session) -> Dict[str, any]:
-        """Run complete data ingestion pipeline."""
-        print(f"\n{'#'*60}")
-        print(f"FULL INGESTION PIPELINE - {datetime.utcnow().isoformat()}")
-        print(f"{'#'*60}\n")
+        """
+        Run complete data ingestion pipeline.
+
+        News, quotes and sentiment touch disjoint tables and upstream APIs,
+        so on PostgreSQL the three stages run concurrently, each in its own
+        session, and db is not used. SQLite allows a single writer, so there
+        the stages run one after another on db instead.
+        """
+        logger.info("FULL INGESTION PIPELINE - %s", datetime.utcnow().isoformat())
 
         results = {}
 
-        # 1. News ingestion
-        news_results = self.ingest_all_news(db, limit_per_source=10)
-        results["news"] = news_results
+        if db.get_bind().dialect.name == "sqlite":
+            news_results = self.ingest_all_news(db, limit_per_source=10)
+            quote_count = self.update_stock_quotes(db)
+            sentiment_count = self.ingest_sentiment(db, limit=25)
+        else:
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                # 1. News ingestion
+                news_future = executor.submit(self.run_in_session, self.ingest_all_news, limit_per_source=10)
+                # 2. Stock quotes
+                quotes_future = executor.submit(self.run_in_session, self.update_stock_quotes)
+                # 3. Sentiment
+                sentiment_future = executor.submit(self.run_in_session, self.ingest_sentiment, limit=25)
+
+                news_results = news_future.result()
+                quote_count = quotes_future.result()
+                sentiment_count = sentiment_future.result()
 
-        # 2. Stock quotes
-        quote_count = self.update_stock_quotes(db)
+        results["news"] = news_results
         results["stock_quotes"] = quote_count
-
-        # 3. Sentiment
-        sentiment_count = self.ingest_sentiment(db, limit=25)
         results["sentiment_posts"] = sentiment_count
 
         # Summary
         total_news = sum(news_results.values())
-        print(f"\n{'#'*60}")
-        print(f"PIPELINE COMPLETE")
-        print(f"  News articles: {total_news}")
-        print(f"  Stock quotes: {quote_count}")
-        print(f"  Sentiment posts: {sentiment_count}")
-        print(f"{'#'*60}\n")
+        logger.info(
+            "PIPELINE COMPLETE - news articles: %d, stock quotes: %d, sentiment posts: %d",
+            total_news, quote_count, sentiment_count,
+        )
 
         return results
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 from datetime import datetime
 
 from apscheduler.schedulers.background import BackgroundScheduler
@@ -7,9 +8,11 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from app.database import SessionLocal
 from app.services.ingestion import ingest_all_feeds
 from app.agents.pipeline import process_unprocessed_articles
-from app.services.backtest import run_backtest_for_unvalidated
+from app.services.backtest import clear_price_cache, run_backtest_for_unvalidated
 from app.services.ingestion_orchestrator import IngestionOrchestrator
 
+logger = logging.getLogger(__name__)
+
 scheduler = BackgroundScheduler()
 
 
@@ -27,55 +30,63 @@ def _is_market_hours() -> bool:
 
 def scheduled_ingestion():
     """Periodic job: ingest news from RSS + web scrapers, process through AI, and back-test."""
-    print("\n=== Scheduled Ingestion Starting ===")
+    logger.info("=== Scheduled Ingestion Starting ===")
+    clear_price_cache()
     db = SessionLocal()
     try:
-        # Step 1a: Ingest from RSS feeds
-        print("[1/5] Ingesting RSS feeds...")
+        # Step 1a: Ingest from RSS feeds. Kept sequential with 1b: both write the same
+        # articles table and several feeds overlap the scraped sites' URLs.
+        logger.info("[1/5] Ingesting RSS feeds...")
         rss_results = ingest_all_feeds(db)
         rss_new = sum(rss_results.values())
-        print(f"[1/5] Ingested {rss_new} articles from RSS")
+        logger.info("[1/5] Ingested %d articles from RSS", rss_new)
 
         # Step 1b: Ingest from web scrapers
-        print("[2/5] Scraping web news sources...")
+        logger.info("[2/5] Scraping web news sources...")
         orchestrator = IngestionOrchestrator()
         try:
             web_results = orchestrator.ingest_all_news(db, limit_per_source=10)
             web_new = sum(web_results.values())
-            print(f"[2/5] Scraped {web_new} articles from web sources")
+            logger.info("[2/5] Scraped %d articles from web sources", web_new)
         except Exception as e:
-            print(f"[2/5] Web scraping error (non-fatal): {e}")
+            logger.warning("[2/5] Web scraping error (non-fatal): %s", e)
             web_new = 0
 
         total_new = rss_new + web_new
 
         # Step 2: Process through AI pipeline
         if total_new > 0:
-            print("[3/5] Processing through AI pipeline...")
+            logger.info("[3/5] Processing through AI pipeline...")
             process_result = process_unprocessed_articles(db, limit=10)
-            print(f"[3/5] Processed {process_result['articles_processed']} articles, generated {process_result['signals_generated']} signals")
+            logger.info(
+                "[3/5] Processed %d articles, generated %d signals",
+                process_result["articles_processed"], process_result["signals_generated"],
+            )
 
             # Step 3: Run back-tests
-            print("[4/5] Running back-tests...")
+            logger.info("[4/5] Running back-tests...")
             bt_result = run_backtest_for_unvalidated(db)
-            print(f"[4/5] Tested {bt_result['signals_tested']} signals, created {bt_result['results_created']} results")
+            logger.info(
+                "[4/5] Tested %d signals, created %d results",
+                bt_result["signals_tested"], bt_result["results_created"],
+            )
         else:
-            print("[3/5] No new articles to process")
-            print("[4/5] Skipping back-tests")
+            logger.info("[3/5] No new articles to process")
+            logger.info("[4/5] Skipping back-tests")
 
         # Step 5: Ingest sentiment data
-        print("[5/5] Scraping Reddit sentiment...")
+        logger.info("[5/5] Scraping Reddit sentiment...")
         try:
             sentiment_count = orchestrator.ingest_sentiment(db, limit=25)
-            print(f"[5/5] Scraped {sentiment_count} sentiment posts")
+            logger.info("[5/5] Scraped %d sentiment posts", sentiment_count)
         except Exception as e:
-            print(f"[5/5] Sentiment scraping error (non-fatal): {e}")
+            logger.warning("[5/5] Sentiment scraping error (non-fatal): %s", e)
 
     except Exception as e:
-        print(f"Scheduled ingestion error: {e}")
+        logger.exception("Scheduled ingestion error: %s", e)
     finally:
         db.close()
-    print("=== Scheduled Ingestion Complete ===\n")
+    logger.info("=== Scheduled Ingestion Complete ===")
 
 
 def scheduled_stock_quotes():
@@ -83,17 +94,17 @@ def scheduled_stock_quotes():
     if not _is_market_hours():
         return
 
-    print("\n=== Stock Quote Update Starting ===")
+    logger.info("=== Stock Quote Update Starting ===")
     db = SessionLocal()
     try:
         orchestrator = IngestionOrchestrator()
         count = orchestrator.update_stock_quotes(db)
-        print(f"Updated {count} stock quotes")
+        logger.info("Updated %d stock quotes", count)
     except Exception as e:
-        print(f"Stock quote update error: {e}")
+        logger.exception("Stock quote update error: %s", e)
     finally:
         db.close()
-    print("=== Stock Quote Update Complete ===\n")
+    logger.info("=== Stock Quote Update Complete ===")
 
 
 def start_scheduler():
@@ -117,9 +128,10 @@ def start_scheduler():
     )
 
     scheduler.start()
-    print("Scheduler started:")
-    print("  - News + sentiment ingestion: every 30 minutes")
-    print("  - Stock quotes: every 15 minutes (market hours only)")
+    logger.info(
+        "Scheduler started: news + sentiment ingestion every 30 minutes, "
+        "stock quotes every 15 minutes (market hours only)"
+    )
 
 
 def stop_scheduler():
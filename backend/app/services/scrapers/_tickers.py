@@ -0,0 +1,52 @@
+"""Ticker-symbol extraction shared by the sentiment scrapers."""
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from app.config import get_settings
+
+
+@lru_cache(maxsize=1)
+def _ticker_index() -> Tuple[re.Pattern, Dict[str, str]]:
+    """
+    Compile the known tickers (settings.tsx_stocks) into one alternation regex, once.
+
+    Returns the pattern (group 1 is the base symbol, an optional .TO suffix is
+    consumed) and a base -> canonical ticker map. Longest symbols come first so
+    the alternation prefers e.g. BNS over BN.
+    """
+    canonical = {t.replace(".TO", ""): t for t in get_settings().tsx_stocks}
+    alternation = "|".join(map(re.escape, sorted(canonical, key=len, reverse=True)))
+    # A bare symbol followed by another suffix (e.g. BNS.A) is a different security,
+    # and a symbol that is itself such a suffix (the T in XYZ.T) is not a mention
+    pattern = re.compile(rf"(?<![A-Z]\.)\b({alternation})(?:\.TO\b|\b(?!\.[A-Z]{{1,2}}\b))")
+    return pattern, canonical
+
+
+@lru_cache(maxsize=2048)
+def _cached_tickers(text: str) -> Tuple[str, ...]:
+    # Memoized per text: the same post/tweet comes back across sorts, searches and runs
+    pattern, canonical = _ticker_index()
+    return tuple({canonical[m.group(1)] for m in pattern.finditer(text)})
+
+
+# Cheap gate before the alternation scan: every ticker contains an uppercase letter.
+# (Requiring a 2+ letter run would miss single-letter tickers such as T.TO or L.TO.)
+_HAS_UPPER_RE = re.compile(r"[A-Z]")
+
+
+# Tickers almost always appear in the title or opening lines; longer bodies are only
+# scanned past this point when the head mentions none
+_TICKER_SCAN_CHARS = 2048
+
+
+def extract_tickers(text: str) -> List[str]:
+    """Extract known stock ticker symbols from text in a single regex scan."""
+    if not _HAS_UPPER_RE.search(text):
+        return []
+    tickers = _cached_tickers(text[:_TICKER_SCAN_CHARS])
+    if not tickers and len(text) > _TICKER_SCAN_CHARS:
+        tickers = _cached_tickers(text)
+    return list(tickers)
@@ -1,15 +1,69 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import itertools
+import logging
+import threading
 import time
 import random
+import re
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import List, Optional, Dict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import List, Optional, Dict, Union
 from urllib.parse import urlparse
 
+import httpx
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import html as lxml_html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.services.async_utils import run_sync
+
+logger = logging.getLogger(__name__)
+
+# BeautifulSoup tree builder: the C-based libxml2 backend
+HTML_PARSER = "lxml"
+
+_HEADER_CHARSET_RE = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.I)
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?\s*([\w.:-]+)", re.I)
+
+
+def _detect_charset(content: bytes, content_type: Optional[str]) -> str:
+    """Charset from the Content-Type header, else a <meta charset> in the first 4 KB, else UTF-8."""
+    match = _HEADER_CHARSET_RE.search(content_type or "")
+    if match:
+        return match.group(1)
+    match = _META_CHARSET_RE.search(content[:4096])
+    if match:
+        return match.group(1).decode("ascii")
+    return "utf-8"
+
+
+class _HostThrottle:
+    """Request spacing state for one host, shared by every scraper instance."""
+
+    __slots__ = ("lock", "last_request")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.last_request = 0.0
+
+
+_HOST_THROTTLES: Dict[str, _HostThrottle] = {}
+_HOST_THROTTLES_LOCK = threading.Lock()
+
+
+def _get_host_throttle(host: str) -> _HostThrottle:
+    with _HOST_THROTTLES_LOCK:
+        throttle = _HOST_THROTTLES.get(host)
+        if throttle is None:
+            throttle = _HOST_THROTTLES[host] = _HostThrottle()
+        return throttle
 
 
 class BaseScraper(ABC):
@@ -23,7 +77,13 @@ class BaseScraper(ABC):
     base_url: str = ""
     request_delay: float = 1.0  # Seconds to wait between requests
     max_retries: int = 3
+    retry_backoff: float = 1.0  # Base seconds for exponential backoff between retries
     timeout: int = 30
+    pool_size: int = 32  # Keep-alive connections per host
+    fetch_concurrency: int = 8  # Max in-flight requests in _fetch_many
+
+    # Status codes that urllib3 retries with exponential backoff
+    RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
 
     # User agents for rotation
     USER_AGENTS = [
@@ -33,31 +93,86 @@ class BaseScraper(ABC):
         "Mozilla/5.0 (X11; Linux x86_64; rv:122.0) Gecko/20100101 Firefox/122.0",
     ]
 
+    # Static headers sent on every request (set once on the session)
+    BASE_HEADERS = {
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.5",
+        "Accept-Encoding": "gzip, deflate, br",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+    }
+
     def __init__(self):
-        self.last_request_time = 0.0
         self.session = requests.Session()
+        self.session.headers.update(self.BASE_HEADERS)
+        self._ua_cycle = itertools.cycle(random.sample(self.USER_AGENTS, len(self.USER_AGENTS)))
+
+        # Pooled keep-alive connections with urllib3-level retries (honours Retry-After)
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.retry_backoff,
+            status_forcelist=self.RETRY_STATUS_CODES,
+            respect_retry_after_header=True,
+            allowed_methods=["GET"],
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=retry,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def _get_headers(self) -> Dict[str, str]:
-        """Return HTTP headers with rotated user agent."""
-        return {
-            "User-Agent": random.choice(self.USER_AGENTS),
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-        }
-
-    def _rate_limit(self):
-        """Enforce rate limiting between requests."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.request_delay:
-            time.sleep(self.request_delay - elapsed)
-        self.last_request_time = time.time()
+        """Return per-request headers (rotated user agent; the rest live on the session)."""
+        return {"User-Agent": next(self._ua_cycle)}
+
+    def _rate_limit(self, url: str = ""):
+        """
+        Enforce per-host rate limiting between requests.
+
+        Spacing is tracked per host across all scraper instances and threads,
+        so parallel scrapers hitting the same site stay polite.
+        """
+        delay = self._reserve_request_slot(url)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _reserve_request_slot(self, url: str) -> float:
+        """
+        Claim the next free request slot for url's host; returns seconds to wait for it.
+
+        Slots are request_delay apart and only reserved under the lock, so sync
+        threads and async fetches share one spacing without sleeping while locked.
+        """
+        host = urlparse(url).netloc or urlparse(self.base_url).netloc
+        throttle = _get_host_throttle(host)
+        with throttle.lock:
+            now = time.monotonic()
+            slot = max(now, throttle.last_request + self.request_delay)
+            throttle.last_request = slot
+        return slot - now
+
+    @staticmethod
+    def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+        """Retry-After as seconds (delta-seconds or HTTP-date form); None if absent or unparseable."""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
 
     def _make_request(self, url: str, method: str = "GET", **kwargs) -> Optional[requests.Response]:
         """
-        Make HTTP request with retry logic and error handling.
+        Make HTTP request with error handling.
+
+        Retries and backoff are handled by the session's mounted HTTPAdapter.
 
         Args:
             url: URL to fetch
@@ -65,76 +180,149 @@ class BaseScraper(ABC):
             **kwargs: Additional arguments to pass to requests
 
         Returns:
-            Response object or None if all retries failed
+            Response object or None if the request failed
         """
         headers = kwargs.pop("headers", {})
         headers.update(self._get_headers())
 
-        for attempt in range(self.max_retries):
-            try:
-                self._rate_limit()
-
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    timeout=self.timeout,
-                    **kwargs
-                )
-
-                # Handle rate limiting
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", 60))
-                    print(f"{self.source_name}: Rate limited. Waiting {retry_after}s...")
-                    time.sleep(retry_after)
+        try:
+            self._rate_limit(url)
+
+            response = self.session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                timeout=self.timeout,
+                **kwargs
+            )
+            response.raise_for_status()
+            return response
+
+        except requests.exceptions.HTTPError as e:
+            logger.warning("%s: HTTP error %s for %s", self.source_name, e.response.status_code, url)
+        except requests.exceptions.RetryError:
+            logger.warning("%s: All retry attempts failed for %s", self.source_name, url)
+        except requests.exceptions.Timeout:
+            logger.warning("%s: Timeout fetching %s", self.source_name, url)
+        except requests.exceptions.RequestException as e:
+            logger.warning("%s: Request failed: %s", self.source_name, e)
+
+        return None
+
+    async def _afetch(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                      url: str) -> Optional[httpx.Response]:
+        """
+        Fetch one URL on the shared async client; returns the (fully read) response or None.
+
+        Mirrors _make_request's politeness: every attempt takes a per-host slot from
+        the shared throttle, and RETRY_STATUS_CODES are retried up to max_retries
+        times, waiting Retry-After when given and exponential backoff otherwise.
+        """
+        async with semaphore:
+            for attempt in range(self.max_retries + 1):
+                delay = self._reserve_request_slot(url)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                try:
+                    response = await client.get(url, headers=self._get_headers())
+                except httpx.HTTPError as e:
+                    logger.warning("%s: Request failed for %s: %s", self.source_name, url, e)
+                    return None
+
+                if response.status_code in self.RETRY_STATUS_CODES and attempt < self.max_retries:
+                    wait = self._retry_after_seconds(response)
+                    if wait is None:
+                        wait = self.retry_backoff * (2 ** attempt)
+                    logger.debug("%s: HTTP %s for %s, retrying in %.1fs",
+                                 self.source_name, response.status_code, url, wait)
+                    await asyncio.sleep(wait)
                     continue
 
-                # Raise for bad status codes
-                response.raise_for_status()
+                if response.is_error:
+                    logger.warning("%s: HTTP error %s for %s", self.source_name, response.status_code, url)
+                    return None
                 return response
+            return None
 
-            except requests.exceptions.Timeout:
-                print(f"{self.source_name}: Timeout on attempt {attempt + 1}/{self.max_retries}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                continue
+    async def _afetch_all(self, urls: List[str]) -> List[Optional[httpx.Response]]:
+        semaphore = asyncio.Semaphore(self.fetch_concurrency)
+        async with httpx.AsyncClient(
+            headers=self.BASE_HEADERS,
+            timeout=self.timeout,
+            follow_redirects=True,
+            # Transport retries only cover connection errors; status retries live in _afetch
+            transport=httpx.AsyncHTTPTransport(retries=self.max_retries),
+        ) as client:
+            return await asyncio.gather(*(self._afetch(client, semaphore, url) for url in urls))
 
-            except requests.exceptions.HTTPError as e:
-                print(f"{self.source_name}: HTTP error {e.response.status_code} for {url}")
-                if e.response.status_code in [403, 404]:
-                    # Don't retry on forbidden/not found
-                    return None
-                if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)
-                continue
+    def _fetch_many(self, urls: List[str]) -> List[Optional[httpx.Response]]:
+        """
+        Fetch several URLs concurrently (bounded by fetch_concurrency), still spaced
+        request_delay apart per host and retried like _make_request.
 
-            except requests.exceptions.RequestException as e:
-                print(f"{self.source_name}: Request failed: {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)
-                continue
+        Returns responses aligned with urls; None for failed fetches.
+        """
+        if not urls:
+            return []
+        return run_sync(self._afetch_all(urls))
 
-        print(f"{self.source_name}: All retry attempts failed for {url}")
-        return None
+    def _parse_html(self, html: Union[str, bytes],
+                    strainer: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+        """
+        Parse HTML content using BeautifulSoup (lxml backend when available).
 
-    def _parse_html(self, html: str) -> Optional[BeautifulSoup]:
-        """Parse HTML content using BeautifulSoup."""
+        An optional SoupStrainer restricts tree construction to the tags the
+        caller actually reads, skipping scripts, styles, ads, etc.
+        """
         try:
-            return BeautifulSoup(html, "lxml")
+            return BeautifulSoup(html, HTML_PARSER, parse_only=strainer)
         except Exception as e:
-            print(f"{self.source_name}: Failed to parse HTML: {e}")
+            logger.warning("%s: Failed to parse HTML: %s", self.source_name, e)
             return None
 
-    def _fetch_and_parse(self, url: str, **kwargs) -> Optional[BeautifulSoup]:
+    def _fetch_and_parse(self, url: str, strainer: Optional[SoupStrainer] = None,
+                         **kwargs) -> Optional[BeautifulSoup]:
         """Fetch URL and return parsed BeautifulSoup object."""
         response = self._make_request(url, **kwargs)
-        if response and response.text:
-            return self._parse_html(response.text)
+        # Hand raw bytes to lxml: skips requests' charset sniffing + str decode
+        # and lets the parser honour the page's own <meta charset>.
+        if response and response.content:
+            return self._parse_html(response.content, strainer)
+        return None
+
+    def _parse_lxml(self, html: Union[str, bytes],
+                    content_type: Optional[str] = None) -> Optional[lxml_html.HtmlElement]:
+        """
+        Parse HTML straight into an lxml element tree (no BeautifulSoup wrapper).
+
+        lxml on its own only sees a <meta charset> and otherwise assumes Latin-1, so
+        bytes are decoded first: Content-Type charset, else <meta charset>, else UTF-8.
+        """
+        try:
+            if isinstance(html, bytes):
+                charset = _detect_charset(html, content_type)
+                try:
+                    text = html.decode(charset, errors="replace")
+                except LookupError:
+                    text = html.decode("utf-8", errors="replace")
+                # Re-encode as UTF-8 and say so: str input would reject <?xml encoding=...?> prologs
+                return lxml_html.fromstring(text.encode("utf-8"), parser=lxml_html.HTMLParser(encoding="utf-8"))
+            return lxml_html.fromstring(html)
+        except Exception as e:
+            logger.warning("%s: Failed to parse HTML: %s", self.source_name, e)
+            return None
+
+    def _fetch_and_parse_lxml(self, url: str, **kwargs) -> Optional[lxml_html.HtmlElement]:
+        """Fetch URL and return its lxml element tree."""
+        response = self._make_request(url, **kwargs)
+        if response and response.content:
+            return self._parse_lxml(response.content, response.headers.get("Content-Type"))
         return None
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def hash_url(url: str) -> str:
-        """Generate SHA256 hash of URL for deduplication."""
+        """Generate SHA256 hash of URL for deduplication (memoized: URLs are hashed in dedup and again on build)."""
         return hashlib.sha256(url.encode()).hexdigest()
 
     @staticmethod
@@ -142,9 +330,23 @@ class BaseScraper(ABC):
         """Clean and normalize text content."""
         if not text:
             return ""
-        # Remove extra whitespace
-        text = " ".join(text.split())
-        return text.strip()
+        # Collapse whitespace runs; split() with no args also drops leading/trailing whitespace
+        return " ".join(text.split())
+
+    @staticmethod
+    def _fast_join(base: str, href: str) -> Optional[str]:
+        """
+        Resolve a listing-page href to an absolute http(s) URL without urljoin's full parse.
+
+        Handles absolute, protocol-relative and root-relative hrefs; anything else is None.
+        """
+        if href.startswith("http"):
+            return href
+        if href.startswith("//"):
+            return "https:" + href
+        if href.startswith("/"):
+            return base + href
+        return None
 
     @staticmethod
     def extract_domain(url: str) -> str:
@@ -1,32 +1,113 @@
 from __future__ import annotations
 
+import logging
 import re
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Optional, Set
-from urllib.parse import urljoin
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, List, Optional, Set, Tuple
 
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
+from ciso8601 import parse_datetime
+from lxml import etree, html as lxml_html
 from sqlalchemy.orm import Session
 
 from app.models import Article
 from app.services.scrapers.base import BaseScraper
 
+logger = logging.getLogger(__name__)
+
+# Parse-only filters: build just the parts of each page the scrapers read
+_LINK_STRAINER = SoupStrainer("a", href=True)
+_TMX_ITEM_STRAINER = SoupStrainer("div", class_="news-list-item")
+_FP_CARD_STRAINER = SoupStrainer("article", class_=lambda x: x and "article-card" in x if x else False)
+
+# URL / title patterns, compiled once
+_BNN_YEAR_RE = re.compile(r"/20\d{2}/\d{2}/")  # BNN article URLs contain /2026/02/
+_GN_ARTICLE_RE = re.compile(r"/news/\d+/")  # Global News article URLs: /news/NUMERIC_ID/slug/
+_IE_ARTICLE_IMAGE_RE = re.compile(r"\s*article\s*(image)?\s*$", re.IGNORECASE)
+_FP_SUBSCRIBER_RE = re.compile(r"^Subscriber only\.\s*", re.IGNORECASE)
+
+# Per-site anchor filters: non-article links are never turned into tags
+_GLOBE_LINK_STRAINER = SoupStrainer("a", href=re.compile(r"/article-"))
+_BNN_LINK_STRAINER = SoupStrainer("a", href=_BNN_YEAR_RE)
+_CBC_LINK_STRAINER = SoupStrainer("a", href=re.compile(r"/news/business/"))
+_GN_LINK_STRAINER = SoupStrainer("a", href=_GN_ARTICLE_RE)
+_NEWS_PATH_LINK_STRAINER = SoupStrainer("a", href=re.compile(r"/news/"))
+
+_DATE_META_KEYS = frozenset({"article:published_time", "datePublished", "og:article:published_time"})
+
+_LOWER_CLASS = "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+
+
+@lru_cache(maxsize=32)
+def _container_xpath(keywords: Tuple[str, ...]) -> etree.XPath:
+    """Compiled XPath matching any div whose class contains one of the keywords (case-insensitive)."""
+    return etree.XPath(" | ".join(f"//div[contains({_LOWER_CLASS}, '{keyword}')]" for keyword in keywords))
+
 
 class _NewsScraperMixin:
     """Common helper methods for all news scrapers."""
 
-    def _deduplicate_url(self, url: str, db: Optional[Session], seen_urls: Set[str]) -> bool:
-        """Return True if this URL should be skipped (duplicate)."""
-        if url in seen_urls:
-            return True
-        seen_urls.add(url)
-
-        if db:
-            url_hash = self.hash_url(url)
-            existing = db.query(Article).filter(Article.url_hash == url_hash).first()
-            if existing:
-                return True
-        return False
+    ARTICLE_CACHE_SIZE = 512
+
+    def __init__(self):
+        super().__init__()
+        # url -> parsed article page, LRU-bounded; avoids re-fetching a URL seen earlier in the run
+        self._article_cache: "OrderedDict[str, dict]" = OrderedDict()
+
+    def _cache_get(self, url: str) -> Optional[dict]:
+        data = self._article_cache.get(url)
+        if data is not None:
+            self._article_cache.move_to_end(url)
+        return data
+
+    def _cache_put(self, url: str, data: Optional[dict]) -> None:
+        # Failures are not cached so a later call can retry the URL
+        if data is None:
+            return
+        self._article_cache[url] = data
+        self._article_cache.move_to_end(url)
+        if len(self._article_cache) > self.ARTICLE_CACHE_SIZE:
+            self._article_cache.popitem(last=False)
+
+    def _preload_seen_hashes(self, db: Optional[Session], urls: List[str]) -> Set[str]:
+        """Return the url_hashes of urls already stored, using a single IN query."""
+        if not db or not urls:
+            return set()
+        hashes = [self.hash_url(url) for url in urls]
+        rows = db.query(Article.url_hash).filter(Article.url_hash.in_(hashes)).all()
+        return {row[0] for row in rows}
+
+    def _drop_stored(self, candidates: List[Tuple[str, str]], db: Optional[Session]) -> List[Tuple[str, str]]:
+        """Filter (url, title) candidates already in the DB."""
+        stored = self._preload_seen_hashes(db, [url for url, _ in candidates])
+        if stored:
+            candidates = [(url, title) for url, title in candidates if self.hash_url(url) not in stored]
+        return candidates
+
+    def _build_articles(self, candidates: List[Tuple[str, str]], limit: int,
+                        container_keywords: Optional[List[str]] = None) -> List[Article]:
+        """
+        Build up to limit articles from (url, title) candidates in listing order.
+
+        Pages are fetched concurrently, one batch per round, each batch only as large
+        as the number of articles still missing; a failed or untitled page is replaced
+        by the next candidate instead of shrinking the result.
+        """
+        articles = []
+        pos = 0
+        while len(articles) < limit and pos < len(candidates):
+            batch = candidates[pos:pos + limit - len(articles)]
+            pos += len(batch)
+            pages = self._scrape_generic_articles([url for url, _ in batch], container_keywords)
+            for (url, title), article_data in zip(batch, pages):
+                if not article_data:
+                    continue
+                articles.append(self._build_article(url, title, article_data))
+                logger.debug("Scraped: %.60s...", articles[-1].title)
+        return articles
 
     def _build_article(self, url: str, title: str, article_data: dict) -> Article:
         """Create a standardized Article object."""
@@ -42,78 +123,103 @@ class _NewsScraperMixin:
             processed=False,
         )
 
-    def _extract_date(self, soup: BeautifulSoup) -> Optional[datetime]:
-        """Extract published date from common patterns."""
-        # Try <time datetime="..."> first
-        time_tag = soup.find("time", {"datetime": True})
-        if time_tag:
+    def _extract_date(self, tree: lxml_html.HtmlElement) -> Optional[datetime]:
+        """Extract published date from <time datetime> or published-time meta tags."""
+        # One tree pass over time/meta elements; first parseable match wins
+        for el in tree.iter("time", "meta"):
+            if el.tag == "time":
+                date_str = el.get("datetime")
+            elif (el.get("property") or el.get("name")) in _DATE_META_KEYS:
+                date_str = el.get("content", "")
+            else:
+                continue
+            if not date_str:
+                continue
             try:
-                date_str = time_tag.get("datetime")
-                return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+                return parse_datetime(date_str)
             except (ValueError, TypeError):
-                pass
-
-        # Try meta tags
-        for prop in ["article:published_time", "datePublished", "og:article:published_time"]:
-            meta = soup.find("meta", {"property": prop}) or soup.find("meta", {"name": prop})
-            if meta:
-                try:
-                    date_str = meta.get("content", "")
-                    return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                except (ValueError, TypeError):
-                    pass
+                continue
 
         return None
 
-    def _extract_content(self, soup: BeautifulSoup, container_keywords: Optional[List[str]] = None) -> str:
+    def _paragraph_texts(self, ps: Iterable[lxml_html.HtmlElement]) -> List[str]:
+        """Cleaned, non-empty text of each paragraph (one text walk per element)."""
+        texts = (self.clean_text(p.text_content()) for p in ps)
+        return [t for t in texts if t]
+
+    def _extract_content(self, tree: lxml_html.HtmlElement, container_keywords: Optional[List[str]] = None) -> str:
         """Extract article content from common patterns."""
         keywords = container_keywords or ["article", "story", "entry", "content", "body"]
         paragraphs = []
 
-        # Try to find article body container
+        # One XPath pass collects every candidate container; keyword priority is applied after
+        containers = _container_xpath(tuple(keywords))(tree)
         for keyword in keywords:
-            container = soup.find(
-                "div",
-                class_=lambda x: x and keyword in str(x).lower() if x else False,
+            container = next(
+                (c for c in containers if keyword in (c.get("class") or "").lower()),
+                None,
             )
-            if container:
-                ps = container.find_all("p")
-                paragraphs = [self.clean_text(p.get_text()) for p in ps if p.get_text().strip()]
+            if container is not None:
+                paragraphs = self._paragraph_texts(container.iter("p"))
                 if paragraphs:
                     break
 
         # Fallback: get all paragraphs
         if not paragraphs:
-            ps = soup.find_all("p", limit=25)
-            paragraphs = [self.clean_text(p.get_text()) for p in ps if p.get_text().strip()]
+            paragraphs = self._paragraph_texts(islice(tree.iter("p"), 25))
 
         return " ".join(paragraphs)
 
-    def _scrape_generic_article(self, url: str, container_keywords: Optional[List[str]] = None) -> Optional[dict]:
-        """Generic article page scraper that works for most news sites."""
-        soup = self._fetch_and_parse(url)
-        if not soup:
-            return None
-
+    def _parse_article_page(self, tree: lxml_html.HtmlElement,
+                            container_keywords: Optional[List[str]] = None) -> Optional[dict]:
+        """Extract title, date and content from a parsed article page."""
         data = {}
 
         # Title
-        title_tag = soup.find("h1") or soup.find("title")
-        if title_tag:
-            data["title"] = self.clean_text(title_tag.get_text())
+        title_tag = tree.find(".//h1")
+        if title_tag is None:
+            title_tag = tree.find(".//title")
+        if title_tag is not None:
+            data["title"] = self.clean_text(title_tag.text_content())
 
         # Date
-        published_at = self._extract_date(soup)
+        published_at = self._extract_date(tree)
         if published_at:
             data["published_at"] = published_at
 
         # Content
-        content = self._extract_content(soup, container_keywords)
+        content = self._extract_content(tree, container_keywords)
         data["content"] = content
         data["summary"] = content[:500] if content else data.get("title", "")
 
         return data if data.get("title") else None
 
+    def _scrape_generic_article(self, url: str, container_keywords: Optional[List[str]] = None) -> Optional[dict]:
+        """Generic article page scraper that works for most news sites."""
+        data = self._cache_get(url)
+        if data is not None:
+            return data
+        tree = self._fetch_and_parse_lxml(url)
+        if tree is None:
+            return None
+        data = self._parse_article_page(tree, container_keywords)
+        self._cache_put(url, data)
+        return data
+
+    def _scrape_generic_articles(self, urls: List[str],
+                                 container_keywords: Optional[List[str]] = None) -> List[Optional[dict]]:
+        """Fetch many article pages concurrently and parse each; results align with urls."""
+        results = [self._cache_get(url) for url in urls]
+        missing = [i for i, data in enumerate(results) if data is None]
+        responses = self._fetch_many([urls[i] for i in missing])
+        for i, response in zip(missing, responses):
+            tree = None
+            if response is not None and response.content:
+                tree = self._parse_lxml(response.content, response.headers.get("Content-Type"))
+            results[i] = self._parse_article_page(tree, container_keywords) if tree is not None else None
+            self._cache_put(urls[i], results[i])
+        return results
+
 
 class GlobeAndMailScraper(_NewsScraperMixin, BaseScraper):
     """Scraper for Globe and Mail Business section."""
@@ -123,46 +229,42 @@ class GlobeAndMailScraper(_NewsScraperMixin, BaseScraper):
     section_url = "https://www.theglobeandmail.com/business/"
 
     def scrape(self, limit: int = 20, db: Session = None) -> List[Article]:
-        print(f"Scraping {self.source_name}...")
+        logger.info("Scraping %s...", self.source_name)
         articles = []
         seen_urls = set()
+        candidates = []
 
-        soup = self._fetch_and_parse(self.section_url)
+        soup = self._fetch_and_parse(self.section_url, _GLOBE_LINK_STRAINER)
         if not soup:
             return articles
 
         # Globe and Mail article URLs always contain /article-
         for link in soup.find_all("a", href=True):
-            if len(articles) >= limit:
-                break
-
             href = link.get("href", "")
-            if not href or "#" in href:
+            # Must be an article page (not navigation/category); cheap string checks before joining
+            if not href or "#" in href or "/article-" not in href:
                 continue
 
-            url = urljoin(self.base_url, href) if href.startswith("/") else href
-            if not url.startswith("http"):
-                continue
-
-            # Must be an article page (not navigation/category)
-            if "/article-" not in url:
+            url = self._fast_join(self.base_url, href)
+            if not url:
                 continue
 
-            if self._deduplicate_url(url, db, seen_urls):
+            if url in seen_urls:
                 continue
+            seen_urls.add(url)
 
             title = self.clean_text(link.get_text())
             if not title or len(title) < 10:
                 continue
 
-            article_data = self._scrape_generic_article(url, ["article"])
-            if not article_data:
-                continue
+            candidates.append((url, title))
 
-            articles.append(self._build_article(url, title, article_data))
-            print(f"  Scraped: {articles[-1].title[:60]}...")
+        candidates = self._drop_stored(candidates, db)
+
+        # Fetch article pages concurrently in listing order, topping up past failed fetches
+        articles = self._build_articles(candidates, limit, ["article"])
 
-        print(f"Scraped {len(articles)} articles from {self.source_name}")
+        logger.info("Scraped %d articles from %s", len(articles), self.source_name)
         return articles
 
 
@@ -174,50 +276,45 @@ class BNNBloombergScraper(_NewsScraperMixin, BaseScraper):
     section_url = "https://www.bnnbloomberg.ca"
 
     def scrape(self, limit: int = 20, db: Session = None) -> List[Article]:
-        print(f"Scraping {self.source_name}...")
+        logger.info("Scraping %s...", self.source_name)
         articles = []
         seen_urls = set()
+        candidates = []
 
-        soup = self._fetch_and_parse(self.section_url)
+        soup = self._fetch_and_parse(self.section_url, _BNN_LINK_STRAINER)
         if not soup:
             return articles
 
-        # BNN article URLs contain year patterns like /2026/02/
-        year_pattern = re.compile(r"/20\d{2}/\d{2}/")
-
         for link in soup.find_all("a", href=True):
-            if len(articles) >= limit:
-                break
-
             href = link.get("href", "")
-            if not href or "#" in href:
+            # Must contain a date pattern (checked on the raw href, before joining)
+            if not href or "#" in href or not _BNN_YEAR_RE.search(href):
                 continue
 
-            url = urljoin(self.base_url, href) if href.startswith("/") else href
-            if not url.startswith("http"):
+            url = self._fast_join(self.base_url, href)
+            if not url:
                 continue
 
-            # Must be from BNN and contain a date pattern
+            # Must be from BNN
             if "bnnbloomberg.ca" not in url:
                 continue
-            if not year_pattern.search(url):
-                continue
 
-            if self._deduplicate_url(url, db, seen_urls):
+            if url in seen_urls:
                 continue
+            seen_urls.add(url)
 
             title = self.clean_text(link.get_text())
             if not title or len(title) < 10:
                 continue
 
-            article_data = self._scrape_generic_article(url, ["article"])
-            if not article_data:
-                continue
+            candidates.append((url, title))
 
-            articles.append(self._build_article(url, title, article_data))
-            print(f"  Scraped: {articles[-1].title[:60]}...")
+        candidates = self._drop_stored(candidates, db)
 
-        print(f"Scraped {len(articles)} articles from {self.source_name}")
+        # Fetch article pages concurrently in listing order, topping up past failed fetches
+        articles = self._build_articles(candidates, limit, ["article"])
+
+        logger.info("Scraped %d articles from %s", len(articles), self.source_name)
         return articles
 
 
@@ -228,50 +325,51 @@ class CBCNewsScraper(_NewsScraperMixin, BaseScraper):
     base_url = "https://www.cbc.ca"
     section_url = "https://www.cbc.ca/news/business"
 
+    _DIGITS = frozenset("0123456789")
+
     def scrape(self, limit: int = 20, db: Session = None) -> List[Article]:
-        print(f"Scraping {self.source_name}...")
+        logger.info("Scraping %s...", self.source_name)
         articles = []
         seen_urls = set()
+        candidates = []
 
-        soup = self._fetch_and_parse(self.section_url)
+        soup = self._fetch_and_parse(self.section_url, _CBC_LINK_STRAINER)
         if not soup:
             return articles
 
         # CBC article URLs: /news/business/slug-with-numeric-id-9.XXXXXXX
         for link in soup.find_all("a", href=True):
-            if len(articles) >= limit:
-                break
-
             href = link.get("href", "")
             if not href or "#" in href:
                 continue
 
-            url = urljoin(self.base_url, href) if href.startswith("/") else href
-            if not url.startswith("http"):
+            # Must be a business article with a numeric ID at the end; check before joining
+            if "/news/business/" not in href:
                 continue
-
-            # Must be a business article with a numeric ID at the end
-            if "/news/business/" not in url:
+            last_segment = (href[:-1] if href.endswith("/") else href).rpartition("/")[2]
+            if self._DIGITS.isdisjoint(last_segment):
                 continue
-            last_segment = url.rstrip("/").split("/")[-1]
-            if not any(char.isdigit() for char in last_segment):
+
+            url = self._fast_join(self.base_url, href)
+            if not url:
                 continue
 
-            if self._deduplicate_url(url, db, seen_urls):
+            if url in seen_urls:
                 continue
+            seen_urls.add(url)
 
             title = self.clean_text(link.get_text())
             if not title or len(title) < 10:
                 continue
 
-            article_data = self._scrape_generic_article(url, ["story", "article"])
-            if not article_data:
-                continue
+            candidates.append((url, title))
 
-            articles.append(self._build_article(url, title, article_data))
-            print(f"  Scraped: {articles[-1].title[:60]}...")
+        candidates = self._drop_stored(candidates, db)
+
+        # Fetch article pages concurrently in listing order, topping up past failed fetches
+        articles = self._build_articles(candidates, limit, ["story", "article"])
 
-        print(f"Scraped {len(articles)} articles from {self.source_name}")
+        logger.info("Scraped %d articles from %s", len(articles), self.source_name)
         return articles
 
 
@@ -283,49 +381,69 @@ class TMXNewsScraper(_NewsScraperMixin, BaseScraper):
     section_url = "https://www.tsx.com/en/news"
 
     def scrape(self, limit: int = 20, db: Session = None) -> List[Article]:
-        print(f"Scraping {self.source_name}...")
+        logger.info("Scraping %s...", self.source_name)
         articles = []
         seen_urls = set()
 
-        soup = self._fetch_and_parse(self.section_url)
+        soup = self._fetch_and_parse(self.section_url, _TMX_ITEM_STRAINER)
         if not soup:
             return articles
 
         # TMX uses 'news-list-item' divs with links like /en/news?id=1144&year=2026
         news_items = soup.find_all("div", class_="news-list-item")
 
+        candidates = []
+        listing_summaries = {}
         for item in news_items:
-            if len(articles) >= limit:
-                break
-
             link = item.find("a", href=True)
             if not link:
                 continue
 
             href = link.get("href", "")
-            url = urljoin(self.base_url, href) if href.startswith("/") else href
+            url = self._fast_join(self.base_url, href)
+            if not url:
+                continue
 
             # Must have id= parameter (indicates actual news release)
             if "id=" not in url:
                 continue
 
-            if self._deduplicate_url(url, db, seen_urls):
+            if url in seen_urls:
                 continue
+            seen_urls.add(url)
 
             title = self.clean_text(link.get_text())
             if not title or len(title) < 10:
                 continue
 
-            # For TMX news items, scrape the linked page
-            article_data = self._scrape_generic_article(url, ["content", "article", "news"])
+            # A listing row that already carries a summary paragraph needs no detail fetch
+            summary_tag = item.find("p")
+            if summary_tag:
+                summary = self.clean_text(summary_tag.get_text())
+                if summary:
+                    listing_summaries[url] = summary
+
+            candidates.append((url, title))
+
+        candidates = self._drop_stored(candidates, db)[:limit]
+
+        # Scrape the linked pages (concurrently) only for items without a listing summary
+        fetch_urls = [url for url, _ in candidates if url not in listing_summaries]
+        pages = dict(zip(fetch_urls, self._scrape_generic_articles(fetch_urls, ["content", "article", "news"])))
+        for url, title in candidates:
+            if url in listing_summaries:
+                summary = listing_summaries[url]
+                article_data = {"title": title, "content": summary, "summary": summary}
+            else:
+                article_data = pages.get(url)
             if not article_data:
                 # If page scrape fails, still create article from list data
                 article_data = {"title": title, "content": title, "summary": title}
 
             articles.append(self._build_article(url, title, article_data))
-            print(f"  Scraped: {articles[-1].title[:60]}...")
+            logger.debug("Scraped: %.60s...", articles[-1].title)
 
-        print(f"Scraped {len(articles)} articles from {self.source_name}")
+        logger.info("Scraped %d articles from %s", len(articles), self.source_name)
         return articles
 
 
@@ -337,13 +455,13 @@ class InvestmentExecutiveScraper(_NewsScraperMixin, BaseScraper):
     section_url = "https://www.investmentexecutive.com"
 
     # Generic category/section slugs to skip
-    SKIP_SLUGS = {
+    SKIP_SLUGS = frozenset({
         "industry-news", "from-the-regulators", "research-and-markets",
         "for-your-clients", "letters-to-the-editor", "in-depth",
         "insight", "building-your-business", "soundbites", "feature",
         "newspaper", "tools", "inside-track", "webinars", "news",
         "uncategorized", "equities", "writer",
-    }
+    })
 
     def _is_article_url(self, url: str) -> bool:
         """Check if URL looks like an article (not a category/section page)."""
@@ -356,11 +474,8 @@ class InvestmentExecutiveScraper(_NewsScraperMixin, BaseScraper):
         if path_parts[0] != "news":
             return False
 
-        # Skip if ALL parts are generic category names
-        if all(p in self.SKIP_SLUGS for p in path_parts):
-            return False
-
-        # Last segment must be a real article slug: has hyphens and is long enough
+        # Last segment must be a real article slug: not a category name (this also rejects
+        # paths made only of category names), has hyphens and is long enough
         last_segment = path_parts[-1]
         if last_segment in self.SKIP_SLUGS:
             return False
@@ -373,25 +488,23 @@ class InvestmentExecutiveScraper(_NewsScraperMixin, BaseScraper):
         return True
 
     def scrape(self, limit: int = 20, db: Session = None) -> List[Article]:
-        print(f"Scraping {self.source_name}...")
+        logger.info("Scraping %s...", self.source_name)
         articles = []
         seen_urls = set()
+        candidates = []
 
-        soup = self._fetch_and_parse(self.section_url)
+        soup = self._fetch_and_parse(self.section_url, _LINK_STRAINER)
         if not soup:
             return articles
 
         # Scan all links and filter for article URLs
         for link in soup.find_all("a", href=True):
-            if len(articles) >= limit:
-                break
-
             href = link.get("href", "")
             if not href or "#" in href:
                 continue
 
-            url = urljoin(self.base_url, href) if href.startswith("/") else href
-            if not url.startswith("http"):
+            url = self._fast_join(self.base_url, href)
+            if not url:
                 continue
 
             if "investmentexecutive.com" not in url:
@@ -400,23 +513,24 @@ class InvestmentExecutiveScraper(_NewsScraperMixin, BaseScraper):
             if not self._is_article_url(url):
                 continue
 
-            if self._deduplicate_url(url, db, seen_urls):
+            if url in seen_urls:
                 continue
+            seen_urls.add(url)
 
             title = self.clean_text(link.get_text())
             # Remove trailing "article image" text from IE's HTML
-            title = re.sub(r"\s*article\s*(image)?\s*$", "", title, flags=re.IGNORECASE).strip()
+            title = _IE_ARTICLE_IMAGE_RE.sub("", title).strip()
             if not title or len(title) < 10:
                 continue
 
-            article_data = self._scrape_generic_article(url, ["entry", "article", "content"])
-            if not article_data:
-                continue
+            candidates.append((url, title))
 
-            articles.append(self._build_article(url, title, article_data))
-            print(f"  Scraped: {articles[-1].title[:60]}...")
+        candidates = self._drop_stored(candidates, db)
+
+        # Fetch article pages concurrently in listing order, topping up past failed fetches
+        articles = self._build_articles(candidates, limit, ["entry", "article", "content"])
 
-        print(f"Scraped {len(articles)} articles from {self.source_name}")
+        logger.info("Scraped %d articles from %s", len(articles), self.source_name)
         return articles
 
 
@@ -428,49 +542,44 @@ class GlobalNewsScraper(_NewsScraperMixin, BaseScraper):
     section_url = "https://globalnews.ca/money/"
 
     def scrape(self, limit: int = 20, db: Session = None) -> List[Article]:
-        print(f"Scraping {self.source_name}...")
+        logger.info("Scraping %s...", self.source_name)
         articles = []
         seen_urls = set()
+        candidates = []
 
-        soup = self._fetch_and_parse(self.section_url)
+        soup = self._fetch_and_parse(self.section_url, _GN_LINK_STRAINER)
         if not soup:
             return articles
 
-        # Global News article URLs: /news/NUMERIC_ID/slug/
-        article_pattern = re.compile(r"/news/\d+/")
-
         for link in soup.find_all("a", href=True):
-            if len(articles) >= limit:
-                break
-
             href = link.get("href", "")
-            if not href or "#" in href:
+            # Article path (/news/NUMERIC_ID/) checked on the raw href, before joining
+            if not href or "#" in href or not _GN_ARTICLE_RE.search(href):
                 continue
 
-            url = urljoin(self.base_url, href) if href.startswith("/") else href
-            if not url.startswith("http"):
+            url = self._fast_join(self.base_url, href)
+            if not url:
                 continue
 
             if "globalnews.ca" not in url:
                 continue
-            if not article_pattern.search(url):
-                continue
 
-            if self._deduplicate_url(url, db, seen_urls):
+            if url in seen_urls:
                 continue
+            seen_urls.add(url)
 
             title = self.clean_text(link.get_text())
             if not title or len(title) < 10:
                 continue
 
-            article_data = self._scrape_generic_article(url, ["story", "article", "entry"])
-            if not article_data:
-                continue
+            candidates.append((url, title))
 
-            articles.append(self._build_article(url, title, article_data))
-            print(f"  Scraped: {articles[-1].title[:60]}...")
+        candidates = self._drop_stored(candidates, db)
 
-        print(f"Scraped {len(articles)} articles from {self.source_name}")
+        # Fetch article pages concurrently in listing order, topping up past failed fetches
+        articles = self._build_articles(candidates, limit, ["story", "article", "entry"])
+
+        logger.info("Scraped %d articles from %s", len(articles), self.source_name)
         return articles
 
 
@@ -482,34 +591,32 @@ class FinancialPostScraper(_NewsScraperMixin, BaseScraper):
     section_url = "https://financialpost.com"
 
     # Category paths that indicate section pages, not articles
-    SECTION_PATHS = {
+    SECTION_PATHS = frozenset({
         "category", "register", "sign-in", "newsletters", "subscribe",
         "my-account", "privacy", "terms", "about", "contact",
-    }
+    })
 
     def scrape(self, limit: int = 20, db: Session = None) -> List[Article]:
-        print(f"Scraping {self.source_name}...")
+        logger.info("Scraping %s...", self.source_name)
         articles = []
         seen_urls = set()
+        candidates = []
 
-        soup = self._fetch_and_parse(self.section_url)
+        soup = self._fetch_and_parse(self.section_url, _FP_CARD_STRAINER)
         if not soup:
             return articles
 
         # FP uses <article> tags with class 'article-card'
-        article_tags = soup.find_all("article", class_=lambda x: x and "article-card" in x if x else False)
+        article_tags = soup.select('article[class*="article-card"]')
 
         for article_tag in article_tags:
-            if len(articles) >= limit:
-                break
-
             link = article_tag.find("a", href=True)
             if not link:
                 continue
 
             href = link.get("href", "")
-            url = urljoin(self.base_url, href) if href.startswith("/") else href
-            if not url.startswith("http"):
+            url = self._fast_join(self.base_url, href)
+            if not url:
                 continue
 
             if "financialpost.com" not in url:
@@ -525,23 +632,24 @@ class FinancialPostScraper(_NewsScraperMixin, BaseScraper):
             if len(url_path.split("/")) < 2:
                 continue
 
-            if self._deduplicate_url(url, db, seen_urls):
+            if url in seen_urls:
                 continue
+            seen_urls.add(url)
 
             title = self.clean_text(link.get_text())
             # Remove "Subscriber only." prefix
-            title = re.sub(r"^Subscriber only\.\s*", "", title, flags=re.IGNORECASE).strip()
+            title = _FP_SUBSCRIBER_RE.sub("", title).strip()
             if not title or len(title) < 10:
                 continue
 
-            article_data = self._scrape_generic_article(url, ["article", "story", "content"])
-            if not article_data:
-                continue
+            candidates.append((url, title))
 
-            articles.append(self._build_article(url, title, article_data))
-            print(f"  Scraped: {articles[-1].title[:60]}...")
+        candidates = self._drop_stored(candidates, db)
 
-        print(f"Scraped {len(articles)} articles from {self.source_name}")
+        # Fetch article pages concurrently in listing order, topping up past failed fetches
+        articles = self._build_articles(candidates, limit, ["article", "story", "content"])
+
+        logger.info("Scraped %d articles from %s", len(articles), self.source_name)
         return articles
 
 
@@ -556,21 +664,27 @@ class YahooFinanceCanadaScraper(_NewsScraperMixin, BaseScraper):
     def scrape(self, limit: int = 20, db: Session = None) -> List[Article]:
         import feedparser
 
-        print(f"Scraping {self.source_name}...")
+        logger.info("Scraping %s...", self.source_name)
         articles = []
         seen_urls = set()
 
+        # Fetch through the pooled session (keep-alive, retries, per-host throttle)
+        response = self._make_request(self.rss_url)
+
         try:
-            feed = feedparser.parse(self.rss_url)
+            feed = feedparser.parse(response.content) if response is not None else None
         except Exception as e:
-            print(f"  Failed to parse RSS feed: {e}")
+            logger.warning("%s: Failed to parse RSS feed: %s", self.source_name, e)
             return articles
 
-        if not feed.entries:
+        if not feed or not feed.entries:
             # Fallback: try scraping the main page
             return self._scrape_html_fallback(limit, db, seen_urls)
 
-        for entry in feed.entries[:limit * 2]:
+        entries = feed.entries[:limit * 2]
+        stored_hashes = self._preload_seen_hashes(db, [e.get("link", "") for e in entries if e.get("link")])
+
+        for entry in entries:
             if len(articles) >= limit:
                 break
 
@@ -578,8 +692,9 @@ class YahooFinanceCanadaScraper(_NewsScraperMixin, BaseScraper):
             if not url:
                 continue
 
-            if self._deduplicate_url(url, db, seen_urls):
+            if url in seen_urls or self.hash_url(url) in stored_hashes:
                 continue
+            seen_urls.add(url)
 
             title = self.clean_text(entry.get("title", ""))
             if not title or len(title) < 10:
@@ -601,36 +716,34 @@ class YahooFinanceCanadaScraper(_NewsScraperMixin, BaseScraper):
                 "published_at": published_at,
             }
 
-            # If content is short, try to fetch full article
-            if len(content) < 200:
+            # If the RSS summary is nearly empty, try to fetch the full article
+            if len(content) < 50:
                 full_data = self._scrape_generic_article(url, ["article", "caas-body", "body"])
                 if full_data and len(full_data.get("content", "")) > len(content):
                     article_data["content"] = full_data["content"]
                     article_data["summary"] = full_data["content"][:500]
 
             articles.append(self._build_article(url, title, article_data))
-            print(f"  Scraped: {articles[-1].title[:60]}...")
+            logger.debug("Scraped: %.60s...", articles[-1].title)
 
-        print(f"Scraped {len(articles)} articles from {self.source_name}")
+        logger.info("Scraped %d articles from %s", len(articles), self.source_name)
         return articles
 
     def _scrape_html_fallback(self, limit, db, seen_urls):
         """Fallback HTML scraping if RSS feed fails."""
         articles = []
-        soup = self._fetch_and_parse(self.base_url)
+        candidates = []
+        soup = self._fetch_and_parse(self.base_url, _NEWS_PATH_LINK_STRAINER)
         if not soup:
             return articles
 
         for link in soup.find_all("a", href=True):
-            if len(articles) >= limit:
-                break
-
             href = link.get("href", "")
             if not href or "#" in href:
                 continue
 
-            url = urljoin(self.base_url, href) if href.startswith("/") else href
-            if not url.startswith("http"):
+            url = self._fast_join(self.base_url, href)
+            if not url:
                 continue
 
             if "/news/" not in url:
@@ -639,18 +752,19 @@ class YahooFinanceCanadaScraper(_NewsScraperMixin, BaseScraper):
             if not news_path:
                 continue
 
-            if self._deduplicate_url(url, db, seen_urls):
+            if url in seen_urls:
                 continue
+            seen_urls.add(url)
 
             title = self.clean_text(link.get_text())
             if not title or len(title) < 10:
                 continue
 
-            article_data = self._scrape_generic_article(url, ["article", "caas-body"])
-            if not article_data:
-                continue
+            candidates.append((url, title))
 
-            articles.append(self._build_article(url, title, article_data))
-            print(f"  Scraped: {articles[-1].title[:60]}...")
+        candidates = self._drop_stored(candidates, db)
+
+        # Fetch article pages concurrently in listing order, topping up past failed fetches
+        articles = self._build_articles(candidates, limit, ["article", "caas-body"])
 
         return articles
@@ -2,15 +2,100 @@ from __future__ import annotations
 
 import hashlib
 import json
-import re
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Set
 
+import requests
+from requests.adapters import HTTPAdapter
 from sqlalchemy.orm import Session
+from urllib3.util.retry import Retry
 
+try:
+    from orjson import loads as json_loads  # C-accelerated; decodes bytes directly
+except ImportError:
+    from json import loads as json_loads
+
+from app.database import dialect_insert
+from app.services.scrapers._tickers import extract_tickers
 from app.models import SentimentData
 from app.config import get_settings
 
+logger = logging.getLogger(__name__)
+
+# Max url_hashes per IN (...) dedup query
+_IN_CHUNK_SIZE = 1000
+
+# Reddit public JSON API: identify ourselves, as Reddit requires
+REDDIT_HEADERS = {"User-Agent": "FinancialIntelligencePlatform/1.0"}
+
+
+def _build_session() -> requests.Session:
+    """Shared keep-alive session with urllib3 retries (429/5xx, honours Retry-After)."""
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+        allowed_methods=["GET"],
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=retry))
+    return session
+
+
+# requests.Session is safe for concurrent GETs, so one pool serves all subreddit threads
+_SESSION = _build_session()
+
+
+def _stored_url_hashes(db: Optional[Session], hashes: List[str]) -> Set[str]:
+    """Return the subset of hashes already stored in sentiment_data (one IN query per chunk)."""
+    if not db or not hashes:
+        return set()
+    stored = set()
+    # Read-only lookups: don't flush whatever the caller has pending before each chunk
+    with db.no_autoflush:
+        for i in range(0, len(hashes), _IN_CHUNK_SIZE):
+            chunk = hashes[i:i + _IN_CHUNK_SIZE]
+            rows = db.query(SentimentData.url_hash).filter(SentimentData.url_hash.in_(chunk)).all()
+            stored.update(row[0] for row in rows)
+    return stored
+
+
+# SentimentData fields the scrapers populate (the bulk-insert row shape)
+_ROW_FIELDS = (
+    "source", "source_type", "content", "author", "url", "url_hash", "posted_at",
+    "ingested_at", "upvotes", "comments_count", "tickers_mentioned", "processed",
+)
+
+
+def _insert_sentiment_rows(db: Optional[Session], rows: List[dict]) -> None:
+    """Bulk-insert sentiment rows in one executemany; url_hash conflicts are skipped by the DB."""
+    if not db or not rows:
+        return
+    stmt = dialect_insert(db, SentimentData).on_conflict_do_nothing(index_elements=["url_hash"])
+    db.execute(stmt, rows)
+    db.commit()
+
+
+def _save_new_posts(db: Optional[Session], posts: List[SentimentData]) -> List[SentimentData]:
+    """
+    Drop posts already stored (or repeated within the batch) and bulk-insert the rest.
+
+    Used after concurrent scrapes, which run without a session; returns the new posts.
+    """
+    stored = _stored_url_hashes(db, [p.url_hash for p in posts])
+    new_posts = []
+    for post in posts:
+        if post.url_hash in stored:
+            continue
+        stored.add(post.url_hash)
+        new_posts.append(post)
+    _insert_sentiment_rows(db, [{field: getattr(p, field) for field in _ROW_FIELDS} for p in new_posts])
+    return new_posts
+
 
 class RedditScraper:
     """
@@ -25,60 +110,43 @@ class RedditScraper:
     # Subreddits to scrape
     DEFAULT_SUBREDDITS = ["CanadianInvestor", "CanadaFinance"]
 
-    # Common TSX ticker patterns to detect in posts
-    TICKER_PATTERN = re.compile(
-        r"\b(?:(?:\$)?([A-Z]{1,5}(?:\.[A-Z]{1,2})?)(?:\.TO)?)\b"
-    )
-
     @staticmethod
+    @lru_cache(maxsize=4096)
     def hash_url(url: str) -> str:
+        # Memoized: each URL is hashed for the IN-query pre-check and again in the build loop
         return hashlib.sha256(url.encode()).hexdigest()
 
-    def _extract_tickers(self, text: str) -> List[str]:
-        """Extract stock ticker symbols from text."""
-        settings = get_settings()
-        known_tickers = set(settings.tsx_stocks.keys())
-        # Also match without .TO suffix
-        known_base = {t.replace(".TO", "") for t in known_tickers}
-
-        found = set()
-        for match in self.TICKER_PATTERN.finditer(text):
-            symbol = match.group(1)
-            if symbol in known_base:
-                found.add(f"{symbol}.TO")
-            elif f"{symbol}.TO" in known_tickers:
-                found.add(f"{symbol}.TO")
-            elif symbol in known_tickers:
-                found.add(symbol)
-
-        return list(found)
-
     def scrape_subreddit_json(self, subreddit: str, limit: int = 25,
                               sort: str = "hot", db: Optional[Session] = None) -> List[SentimentData]:
         """
         Scrape subreddit using Reddit's public JSON API (no auth needed).
         """
-        import requests
-
-        print(f"Scraping r/{subreddit} ({sort})...")
+        logger.info("Scraping r/%s (%s)...", subreddit, sort)
         posts = []
+        rows = []
+        now = datetime.utcnow()
 
         url = f"https://www.reddit.com/r/{subreddit}/{sort}.json?limit={limit}"
-        headers = {"User-Agent": "FinancialIntelligencePlatform/1.0"}
 
         try:
-            response = requests.get(url, headers=headers, timeout=15)
+            response = _SESSION.get(url, headers=REDDIT_HEADERS, timeout=15)
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
         except Exception as e:
-            print(f"  Error fetching r/{subreddit}: {e}")
+            logger.warning("Error fetching r/%s: %s", subreddit, e)
             return posts
 
         children = data.get("data", {}).get("children", [])
         if not children:
-            print(f"  No posts found in r/{subreddit}")
+            logger.info("No posts found in r/%s", subreddit)
             return posts
 
+        # Check for duplicates: one IN query for every post in the listing
+        stored = _stored_url_hashes(db, [
+            self.hash_url(f"https://www.reddit.com{child['data']['permalink']}")
+            for child in children if child.get("data", {}).get("permalink")
+        ])
+
         for child in children:
             post_data = child.get("data", {})
             if not post_data:
@@ -90,12 +158,10 @@ class RedditScraper:
             if not post_url:
                 continue
 
-            # Check for duplicates
             url_hash = self.hash_url(post_url)
-            if db:
-                existing = db.query(SentimentData).filter(SentimentData.url_hash == url_hash).first()
-                if existing:
-                    continue
+            if url_hash in stored:
+                continue
+            stored.add(url_hash)
 
             # Extract content
             title = post_data.get("title", "")
@@ -106,13 +172,13 @@ class RedditScraper:
                 continue
 
             # Extract tickers mentioned
-            tickers = self._extract_tickers(content)
+            tickers = extract_tickers(content)
 
             # Parse timestamp
             created_utc = post_data.get("created_utc")
             posted_at = datetime.utcfromtimestamp(created_utc) if created_utc else None
 
-            sentiment_item = SentimentData(
+            row = dict(
                 source=f"Reddit r/{subreddit}",
                 source_type=self.source_type,
                 content=content[:5000],  # Cap content length
@@ -120,22 +186,19 @@ class RedditScraper:
                 url=post_url,
                 url_hash=url_hash,
                 posted_at=posted_at,
-                ingested_at=datetime.utcnow(),
+                ingested_at=now,
                 upvotes=post_data.get("ups", 0),
                 comments_count=post_data.get("num_comments", 0),
                 tickers_mentioned=json.dumps(tickers) if tickers else None,
                 processed=False,
             )
 
-            posts.append(sentiment_item)
-
-            if db:
-                db.add(sentiment_item)
+            rows.append(row)
+            posts.append(SentimentData(**row))
 
-        if db:
-            db.commit()
+        _insert_sentiment_rows(db, rows)
 
-        print(f"  Scraped {len(posts)} posts from r/{subreddit}")
+        logger.info("Scraped %d posts from r/%s", len(posts), subreddit)
         return posts
 
     def scrape_with_praw(self, subreddit: str, limit: int = 25,
@@ -147,17 +210,19 @@ class RedditScraper:
         settings = get_settings()
 
         if not settings.reddit_client_id or not settings.reddit_client_secret:
-            print("  Reddit API credentials not configured, using JSON API fallback")
+            logger.debug("Reddit API credentials not configured, using JSON API fallback")
             return self.scrape_subreddit_json(subreddit, limit, sort, db)
 
         try:
             import praw
         except ImportError:
-            print("  PRAW not installed, using JSON API fallback")
+            logger.info("PRAW not installed, using JSON API fallback")
             return self.scrape_subreddit_json(subreddit, limit, sort, db)
 
-        print(f"Scraping r/{subreddit} ({sort}) via PRAW...")
+        logger.info("Scraping r/%s (%s) via PRAW...", subreddit, sort)
         posts = []
+        rows = []
+        now = datetime.utcnow()
 
         try:
             reddit = praw.Reddit(
@@ -176,24 +241,28 @@ class RedditScraper:
             else:
                 submissions = sub.hot(limit=limit)
 
+            submissions = list(submissions)
+            stored = _stored_url_hashes(
+                db, [self.hash_url(f"https://www.reddit.com{s.permalink}") for s in submissions]
+            )
+
             for submission in submissions:
                 post_url = f"https://www.reddit.com{submission.permalink}"
                 url_hash = self.hash_url(post_url)
 
-                if db:
-                    existing = db.query(SentimentData).filter(SentimentData.url_hash == url_hash).first()
-                    if existing:
-                        continue
+                if url_hash in stored:
+                    continue
+                stored.add(url_hash)
 
                 content = f"{submission.title}\n\n{submission.selftext}".strip()
                 if not content or len(content) < 10:
                     continue
 
-                tickers = self._extract_tickers(content)
+                tickers = extract_tickers(content)
 
                 posted_at = datetime.utcfromtimestamp(submission.created_utc) if submission.created_utc else None
 
-                sentiment_item = SentimentData(
+                row = dict(
                     source=f"Reddit r/{subreddit}",
                     source_type=self.source_type,
                     content=content[:5000],
@@ -201,34 +270,39 @@ class RedditScraper:
                     url=post_url,
                     url_hash=url_hash,
                     posted_at=posted_at,
-                    ingested_at=datetime.utcnow(),
+                    ingested_at=now,
                     upvotes=submission.ups,
                     comments_count=submission.num_comments,
                     tickers_mentioned=json.dumps(tickers) if tickers else None,
                     processed=False,
                 )
 
-                posts.append(sentiment_item)
-                if db:
-                    db.add(sentiment_item)
+                rows.append(row)
+                posts.append(SentimentData(**row))
 
-            if db:
-                db.commit()
+            _insert_sentiment_rows(db, rows)
 
         except Exception as e:
-            print(f"  PRAW error: {e}, falling back to JSON API")
+            logger.warning("PRAW error: %s, falling back to JSON API", e)
             return self.scrape_subreddit_json(subreddit, limit, sort, db)
 
-        print(f"  Scraped {len(posts)} posts from r/{subreddit}")
+        logger.info("Scraped %d posts from r/%s", len(posts), subreddit)
         return posts
 
     def scrape_all(self, limit: int = 25, db: Optional[Session] = None) -> List[SentimentData]:
-        """Scrape all configured subreddits."""
-        all_posts = []
-        for subreddit in self.DEFAULT_SUBREDDITS:
-            posts = self.scrape_with_praw(subreddit, limit=limit, db=db)
-            all_posts.extend(posts)
-        return all_posts
+        """
+        Scrape all configured subreddits.
+
+        Subreddits are fetched concurrently without a session (Session is not
+        thread-safe); dedup and the bulk insert happen afterwards on db.
+        """
+        with ThreadPoolExecutor(max_workers=len(self.DEFAULT_SUBREDDITS)) as executor:
+            futures = [
+                executor.submit(self.scrape_with_praw, subreddit, limit=limit)
+                for subreddit in self.DEFAULT_SUBREDDITS
+            ]
+            all_posts = [post for future in futures for post in future.result()]
+        return _save_new_posts(db, all_posts)
 
 
 class TwitterScraper:
@@ -241,9 +315,9 @@ class TwitterScraper:
     source_name = "Twitter"
     source_type = "social"
 
-    TICKER_PATTERN = re.compile(
-        r"\b(?:(?:\$)?([A-Z]{1,5}(?:\.[A-Z]{1,2})?)(?:\.TO)?)\b"
-    )
+    # handle -> user id; usernames resolve to stable ids, so lookups are shared
+    # across instances for the life of the process
+    _user_ids: Dict[str, int] = {}
 
     def __init__(self):
         settings = get_settings()
@@ -253,7 +327,9 @@ class TwitterScraper:
         self._client = None
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def hash_url(url: str) -> str:
+        # Memoized: each URL is hashed for the IN-query pre-check and again in the build loop
         return hashlib.sha256(url.encode()).hexdigest()
 
     def _get_client(self):
@@ -267,25 +343,18 @@ class TwitterScraper:
             self._client = tweepy.Client(bearer_token=self.bearer_token, wait_on_rate_limit=True)
             return self._client
         except Exception as e:
-            print(f"Twitter: Failed to initialise client: {e}")
+            logger.warning("Twitter: Failed to initialise client: %s", e)
             return None
 
-    def _extract_tickers(self, text: str) -> List[str]:
-        """Extract stock ticker symbols from text."""
-        settings = get_settings()
-        known_tickers = set(settings.tsx_stocks.keys())
-        known_base = {t.replace(".TO", "") for t in known_tickers}
-
-        found = set()
-        for match in self.TICKER_PATTERN.finditer(text):
-            symbol = match.group(1)
-            if symbol in known_base:
-                found.add(f"{symbol}.TO")
-            elif f"{symbol}.TO" in known_tickers:
-                found.add(f"{symbol}.TO")
-            elif symbol in known_tickers:
-                found.add(symbol)
-        return list(found)
+    def _get_user_id(self, client, handle: str) -> Optional[int]:
+        """Resolve a username to its user id, calling get_user only on a cache miss."""
+        user_id = self._user_ids.get(handle)
+        if user_id is None:
+            user_resp = client.get_user(username=handle)
+            if not user_resp.data:
+                return None
+            user_id = self._user_ids[handle] = user_resp.data.id
+        return user_id
 
     def search_recent(self, query: str, limit: int = 20,
                       db: Optional[Session] = None) -> List[SentimentData]:
@@ -297,6 +366,8 @@ class TwitterScraper:
         import tweepy
 
         posts = []
+        rows = []
+        now = datetime.utcnow()
         try:
             # Twitter API v2 recent search (last 7 days)
             response = client.search_recent_tweets(
@@ -316,27 +387,29 @@ class TwitterScraper:
                 for user in response.includes["users"]:
                     users[user.id] = user.username
 
+            # Dedup: one IN query for the whole page of results
+            stored = _stored_url_hashes(db, [
+                self.hash_url(f"https://twitter.com/{users.get(tweet.author_id, 'unknown')}/status/{tweet.id}")
+                for tweet in response.data
+            ])
+
             for tweet in response.data:
                 author = users.get(tweet.author_id, "unknown")
                 tweet_url = f"https://twitter.com/{author}/status/{tweet.id}"
                 url_hash = self.hash_url(tweet_url)
 
-                # Dedup
-                if db:
-                    existing = db.query(SentimentData).filter(
-                        SentimentData.url_hash == url_hash
-                    ).first()
-                    if existing:
-                        continue
+                if url_hash in stored:
+                    continue
+                stored.add(url_hash)
 
                 content = tweet.text or ""
                 if len(content) < 10:
                     continue
 
-                tickers = self._extract_tickers(content)
+                tickers = extract_tickers(content)
                 metrics = tweet.public_metrics or {}
 
-                sentiment_item = SentimentData(
+                row = dict(
                     source=f"Twitter @{author}",
                     source_type=self.source_type,
                     content=content[:5000],
@@ -344,23 +417,21 @@ class TwitterScraper:
                     url=tweet_url,
                     url_hash=url_hash,
                     posted_at=tweet.created_at,
-                    ingested_at=datetime.utcnow(),
+                    ingested_at=now,
                     upvotes=metrics.get("like_count", 0),
                     comments_count=metrics.get("reply_count", 0),
                     tickers_mentioned=json.dumps(tickers) if tickers else None,
                     processed=False,
                 )
-                posts.append(sentiment_item)
-                if db:
-                    db.add(sentiment_item)
+                rows.append(row)
+                posts.append(SentimentData(**row))
 
-            if db:
-                db.commit()
+            _insert_sentiment_rows(db, rows)
 
         except tweepy.errors.TooManyRequests:
-            print("Twitter: Rate limit hit, returning partial results")
+            logger.warning("Twitter: Rate limit hit, returning partial results")
         except Exception as e:
-            print(f"Twitter: Search error for '{query}': {e}")
+            logger.warning("Twitter: Search error for '%s': %s", query, e)
             if db:
                 db.rollback()
 
@@ -378,14 +449,12 @@ class TwitterScraper:
         all_posts = []
         for handle in self.accounts:
             try:
-                # Look up user by username
-                user_resp = client.get_user(username=handle)
-                if not user_resp.data:
-                    print(f"Twitter: User @{handle} not found")
+                # Look up user by username (cached)
+                user_id = self._get_user_id(client, handle)
+                if user_id is None:
+                    logger.info("Twitter: User @%s not found", handle)
                     continue
 
-                user_id = user_resp.data.id
-
                 # Get recent tweets from this user
                 response = client.get_users_tweets(
                     id=user_id,
@@ -397,25 +466,29 @@ class TwitterScraper:
                 if not response.data:
                     continue
 
+                rows = []
+                handle_posts = []
+                now = datetime.utcnow()
+                stored = _stored_url_hashes(
+                    db, [self.hash_url(f"https://twitter.com/{handle}/status/{tweet.id}") for tweet in response.data]
+                )
+
                 for tweet in response.data:
                     tweet_url = f"https://twitter.com/{handle}/status/{tweet.id}"
                     url_hash = self.hash_url(tweet_url)
 
-                    if db:
-                        existing = db.query(SentimentData).filter(
-                            SentimentData.url_hash == url_hash
-                        ).first()
-                        if existing:
-                            continue
+                    if url_hash in stored:
+                        continue
+                    stored.add(url_hash)
 
                     content = tweet.text or ""
                     if len(content) < 10:
                         continue
 
-                    tickers = self._extract_tickers(content)
+                    tickers = extract_tickers(content)
                     metrics = tweet.public_metrics or {}
 
-                    sentiment_item = SentimentData(
+                    row = dict(
                         source=f"Twitter @{handle}",
                         source_type=self.source_type,
                         content=content[:5000],
@@ -423,26 +496,29 @@ class TwitterScraper:
                         url=tweet_url,
                         url_hash=url_hash,
                         posted_at=tweet.created_at,
-                        ingested_at=datetime.utcnow(),
+                        ingested_at=now,
                         upvotes=metrics.get("like_count", 0),
                         comments_count=metrics.get("reply_count", 0),
                         tickers_mentioned=json.dumps(tickers) if tickers else None,
                         processed=False,
                     )
-                    all_posts.append(sentiment_item)
-                    if db:
-                        db.add(sentiment_item)
+                    rows.append(row)
+                    handle_posts.append(SentimentData(**row))
 
-                if db:
-                    db.commit()
+                _insert_sentiment_rows(db, rows)
+                all_posts.extend(handle_posts)
 
-                print(f"  Twitter @{handle}: fetched tweets")
+                logger.debug("Twitter @%s: fetched tweets", handle)
 
             except tweepy.errors.TooManyRequests:
-                print(f"Twitter: Rate limit hit on @{handle}, stopping account scrape")
+                logger.warning("Twitter: Rate limit hit on @%s, stopping account scrape", handle)
                 break
+            except tweepy.errors.NotFound:
+                # Account gone or renamed: drop the cached id so the next run re-resolves it
+                self._user_ids.pop(handle, None)
+                logger.info("Twitter: User @%s not found", handle)
             except Exception as e:
-                print(f"Twitter: Error fetching @{handle}: {e}")
+                logger.warning("Twitter: Error fetching @%s: %s", handle, e)
                 if db:
                     db.rollback()
 
@@ -455,27 +531,20 @@ class TwitterScraper:
         Returns combined, deduplicated results.
         """
         if not self.bearer_token:
-            print("Twitter: No bearer token configured, skipping")
+            logger.info("Twitter: No bearer token configured, skipping")
             return []
 
-        print("Scraping Twitter/X...")
-        all_posts = []
-        seen_hashes = set()
-
-        # 1. Keyword search (use top 3 keywords to stay within rate limits)
-        for keyword in self.keywords[:3]:
-            posts = self.search_recent(keyword, limit=limit, db=db)
-            for p in posts:
-                if p.url_hash not in seen_hashes:
-                    all_posts.append(p)
-                    seen_hashes.add(p.url_hash)
-
-        # 2. Tracked accounts
-        account_posts = self.scrape_accounts(limit=10, db=db)
-        for p in account_posts:
-            if p.url_hash not in seen_hashes:
-                all_posts.append(p)
-                seen_hashes.add(p.url_hash)
-
-        print(f"  Twitter total: {len(all_posts)} posts scraped")
+        logger.info("Scraping Twitter/X...")
+
+        # Keyword searches (top 3 to stay within rate limits) and tracked accounts run
+        # concurrently without a session; dedup and the bulk insert happen afterwards on db
+        keywords = self.keywords[:3]
+        with ThreadPoolExecutor(max_workers=len(keywords) + 1) as executor:
+            futures = [executor.submit(self.search_recent, keyword, limit=limit) for keyword in keywords]
+            futures.append(executor.submit(self.scrape_accounts, limit=10))
+            all_posts = [post for future in futures for post in future.result()]
+
+        all_posts = _save_new_posts(db, all_posts)
+
+        logger.info("Twitter total: %d posts scraped", len(all_posts))
         return all_posts
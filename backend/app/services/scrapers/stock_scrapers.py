@@ -1,15 +1,38 @@
 from __future__ import annotations
 
-import traceback
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
+import httpx
 import yfinance as yf
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
+try:
+    from orjson import loads as json_loads  # C-accelerated; decodes bytes directly
+except ImportError:
+    from json import loads as json_loads
+
+from app.database import dialect_insert
+from app.services.async_utils import run_sync
 from app.models import StockQuote, Top100Stock
 from app.config import get_settings
 
+logger = logging.getLogger(__name__)
+
+_BAR_COLUMNS = ("Close", "Open", "High", "Low", "Volume")
+
+# StockQuote fields _build_quote populates (the bulk-insert row shape)
+_QUOTE_FIELDS = (
+    "ticker", "company_name", "exchange", "current_price", "open_price", "high_price",
+    "low_price", "previous_close", "volume", "price_change", "percent_change", "source",
+    "quote_time", "ingested_at",
+)
+
 
 class YFinanceStockScraper:
     """
@@ -19,71 +42,224 @@ class YFinanceStockScraper:
 
     source_name = "Yahoo Finance"
 
-    def _build_quote(self, ticker: str, latest, previous, settings) -> Optional[StockQuote]:
-        """Build a StockQuote from pandas row data."""
+    # Yahoo v8 chart endpoint: 5 daily bars per ticker (same window as Ticker.history(period="5d"))
+    CHART_URL = "https://query2.finance.yahoo.com/v8/finance/chart/{ticker}?range=5d&interval=1d"
+    CHART_HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+        "Accept": "application/json",
+    }
+    chart_concurrency: int = 16  # Max in-flight chart requests
+    chart_timeout: int = 15
+    download_chunk_size: int = 20  # Symbols per yf.download call
+    history_workers: int = 8  # Threads for per-ticker history() fallbacks
+    bars_cache_ttl: float = 60.0  # Seconds fetched daily bars are reused, persisted quotes included
+
+    # ticker -> (monotonic fetch time, (latest, previous)); lets back-to-back runs skip Yahoo entirely
+    _bars_cache: Dict[str, Tuple[float, Tuple[dict, Optional[dict]]]] = {}
+
+    def _build_quote(self, ticker: str, latest, previous, tsx_map: Dict[str, str],
+                     now: Optional[datetime] = None) -> Optional[StockQuote]:
+        """
+        Build a StockQuote from bar data; tsx_map is settings.tsx_stocks, now the batch timestamp.
+
+        Bars are the plain dicts from _chart_bars/_frame_bars: every OHLCV key is present
+        and already a Python number (missing values are 0).
+        """
+        now = now or datetime.utcnow()
         try:
-            current_price = float(latest.get("Close", 0))
-            if current_price == 0:
+            current_price = latest["Close"]
+            if not current_price:
                 return None
 
-            previous_close = float(previous.get("Close", 0)) if previous is not None else None
+            previous_close = previous["Close"] if previous is not None else None
             price_change = None
             percent_change = None
             if current_price and previous_close and previous_close > 0:
                 price_change = round(current_price - previous_close, 4)
                 percent_change = round((price_change / previous_close) * 100, 4)
 
-            company_name = settings.tsx_stocks.get(ticker, ticker)
+            company_name = tsx_map.get(ticker, ticker)
 
             return StockQuote(
                 ticker=ticker,
                 company_name=company_name,
                 exchange="TSX",
                 current_price=round(current_price, 2),
-                open_price=round(float(latest.get("Open", 0)), 2) or None,
-                high_price=round(float(latest.get("High", 0)), 2) or None,
-                low_price=round(float(latest.get("Low", 0)), 2) or None,
+                open_price=round(latest["Open"], 2) or None,
+                high_price=round(latest["High"], 2) or None,
+                low_price=round(latest["Low"], 2) or None,
                 previous_close=round(previous_close, 2) if previous_close else None,
-                volume=int(latest.get("Volume", 0)) or None,
+                volume=int(latest["Volume"]) or None,
                 price_change=price_change,
                 percent_change=percent_change,
                 source=self.source_name,
-                quote_time=datetime.utcnow(),
-                ingested_at=datetime.utcnow(),
+                quote_time=now,
+                ingested_at=now,
             )
         except Exception as e:
-            print(f"  Error building quote for {ticker}: {e}")
+            logger.warning("Error building quote for %s: %s", ticker, e)
             return None
 
+    @staticmethod
+    def _chart_bars(payload: dict) -> Tuple[Optional[dict], Optional[dict]]:
+        """Latest and previous daily bars from a v8 chart response (bars without a close are skipped)."""
+        quote = payload["chart"]["result"][0]["indicators"]["quote"][0]
+        closes = quote["close"]
+        # Only the last two closed bars are used; walk back from the end instead of building all of them
+        idx = [i for i in range(len(closes) - 1, -1, -1) if closes[i] is not None][:2]
+        bars = [
+            {
+                "Close": closes[i],
+                "Open": quote["open"][i] or 0,
+                "High": quote["high"][i] or 0,
+                "Low": quote["low"][i] or 0,
+                "Volume": quote["volume"][i] or 0,
+            }
+            for i in idx
+        ]
+        if not bars:
+            return None, None
+        return bars[0], bars[1] if len(bars) >= 2 else None
+
+    async def _afetch_chart(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                            ticker: str) -> Optional[Tuple[Optional[dict], Optional[dict]]]:
+        """Fetch one ticker's chart; returns (latest, previous) bars or None on failure."""
+        async with semaphore:
+            try:
+                response = await client.get(self.CHART_URL.format(ticker=ticker))
+                response.raise_for_status()
+                return self._chart_bars(json_loads(response.content))
+            except (httpx.HTTPError, ValueError, KeyError, IndexError, TypeError):
+                return None
+
+    async def _afetch_charts(self, tickers: List[str]) -> List[Optional[Tuple[Optional[dict], Optional[dict]]]]:
+        semaphore = asyncio.Semaphore(self.chart_concurrency)
+        async with httpx.AsyncClient(
+            headers=self.CHART_HEADERS,
+            timeout=self.chart_timeout,
+            limits=httpx.Limits(max_connections=self.chart_concurrency),
+            transport=httpx.AsyncHTTPTransport(retries=2),
+        ) as client:
+            return await asyncio.gather(*(self._afetch_chart(client, semaphore, t) for t in tickers))
+
+    @staticmethod
+    def _frame_bars(frame) -> Tuple[Optional[dict], Optional[dict]]:
+        """Latest and previous bars from a yfinance OHLCV frame (rows without a close are skipped)."""
+        frame = frame.dropna(subset=["Close"])
+        if frame.empty:
+            return None, None
+        # One column-wise cast of the last two rows instead of per-field Series lookups
+        tail = frame[list(_BAR_COLUMNS)].iloc[-2:].fillna(0).to_numpy(dtype="float64")
+        bars = [dict(zip(_BAR_COLUMNS, row.tolist())) for row in tail[::-1]]
+        return bars[0], bars[1] if len(bars) >= 2 else None
+
+    @classmethod
+    def _history_bars(cls, ticker: str) -> Tuple[Optional[dict], Optional[dict]]:
+        """Latest and previous daily bars for one ticker via yfinance."""
+        hist = yf.Ticker(ticker).history(period="5d")
+        if hist.empty:
+            return None, None
+        return cls._frame_bars(hist)
+
+    def _download_bars(self, tickers: List[str]) -> Dict[str, Tuple[Optional[dict], Optional[dict]]]:
+        """
+        Latest and previous daily bars for many tickers via yf.download, in chunks of
+        download_chunk_size symbols. Tickers from a chunk that fails are fetched with
+        per-ticker history() calls spread over history_workers threads.
+        """
+        results = {}
+        individual = []
+        for i in range(0, len(tickers), self.download_chunk_size):
+            chunk = tickers[i:i + self.download_chunk_size]
+            try:
+                df = yf.download(
+                    tickers=chunk, period="5d", group_by="ticker",
+                    threads=True, progress=False, auto_adjust=False,
+                )
+            except Exception as e:
+                logger.warning("yf.download failed for %d tickers, fetching individually: %s", len(chunk), e)
+                individual.extend(chunk)
+                continue
+
+            for ticker in chunk:
+                try:
+                    if df.columns.nlevels > 1:
+                        if ticker in df.columns.get_level_values(0):
+                            results[ticker] = self._frame_bars(df[ticker])
+                    elif not df.empty:
+                        results[ticker] = self._frame_bars(df)
+                except Exception as e:
+                    logger.warning("Error reading bars for %s: %s", ticker, e)
+
+        if individual:
+            with ThreadPoolExecutor(max_workers=min(self.history_workers, len(individual))) as executor:
+                futures = {executor.submit(self._history_bars, t): t for t in individual}
+                for future in as_completed(futures):
+                    ticker = futures[future]
+                    try:
+                        results[ticker] = future.result()
+                    except Exception as e:
+                        logger.warning("Error fetching history for %s: %s", ticker, e)
+        return results
+
+    def _fetch_bars(self, tickers: List[str]) -> Dict[str, Tuple[Optional[dict], Optional[dict]]]:
+        """
+        (latest, previous) bars per ticker: from the bars cache when fetched within
+        bars_cache_ttl, otherwise from the chart API with a yf.download fallback.
+
+        This is the only quote-data cache and every path uses it, the persisting
+        ones included: a refresh within bars_cache_ttl of the previous one stores
+        quotes built from the same bars rather than re-asking Yahoo.
+        """
+        now = time.monotonic()
+        results = {}
+        for ticker in tickers:
+            entry = self._bars_cache.get(ticker)
+            if entry is not None and now - entry[0] < self.bars_cache_ttl:
+                results[ticker] = entry[1]
+
+        to_fetch = [t for t in tickers if t not in results]
+        if not to_fetch:
+            return results
+        charts = run_sync(self._afetch_charts(to_fetch))
+        missed = [ticker for ticker, bars in zip(to_fetch, charts) if bars is None]
+        fetched = dict(zip(to_fetch, charts))
+        if missed:
+            fetched.update(self._download_bars(missed))
+
+        fetched_at = time.monotonic()
+        for ticker, bars in fetched.items():
+            if bars is not None and bars[0] is not None:
+                self._bars_cache[ticker] = (fetched_at, bars)
+                results[ticker] = bars
+        return results
+
     def fetch_quotes_batch(self, tickers: List[str], db: Optional[Session] = None) -> List[StockQuote]:
         """
         Fetch quotes for multiple tickers.
-        Uses individual Ticker.history() calls for reliability.
+
+        All tickers are fetched concurrently from Yahoo's chart API; tickers whose
+        chart request fails are retried together through chunked yf.download calls.
+        Bars fetched within bars_cache_ttl seconds are reused (see _fetch_bars).
         """
-        print(f"Fetching stock quotes for {len(tickers)} tickers...")
+        logger.info("Fetching stock quotes for %d tickers...", len(tickers))
         quotes = []
-        settings = get_settings()
+        tsx_map = get_settings().tsx_stocks
         errors = []
 
+        bars_by_ticker = self._fetch_bars(tickers)
+        now = datetime.utcnow()
+
         for ticker in tickers:
             try:
-                stock = yf.Ticker(ticker)
-                hist = stock.history(period="5d")
-
-                if hist.empty:
+                latest, previous = bars_by_ticker.get(ticker, (None, None))
+                if latest is None:
                     continue
 
-                latest = hist.iloc[-1]
-                previous = hist.iloc[-2] if len(hist) >= 2 else None
-
-                quote = self._build_quote(ticker, latest, previous, settings)
+                quote = self._build_quote(ticker, latest, previous, tsx_map, now)
                 if quote:
                     quotes.append(quote)
-                    change_str = f" ({quote.percent_change:+.2f}%)" if quote.percent_change else ""
-                    print(f"  {ticker}: ${quote.current_price:.2f}{change_str}")
-
-                    if db:
-                        db.add(quote)
+                    logger.debug("%s: $%.2f (%+.2f%%)", ticker, quote.current_price, quote.percent_change or 0.0)
 
             except Exception as e:
                 errors.append(f"{ticker}: {e}")
@@ -91,35 +267,32 @@ class YFinanceStockScraper:
 
         if db and quotes:
             try:
+                # One executemany INSERT instead of a unit-of-work flush per quote
+                db.execute(insert(StockQuote), [{f: getattr(q, f) for f in _QUOTE_FIELDS} for q in quotes])
                 db.commit()
             except Exception as e:
-                print(f"  DB commit error: {e}")
+                logger.warning("DB commit error: %s", e)
                 db.rollback()
 
         if errors:
-            print(f"  Errors for {len(errors)} tickers: {'; '.join(errors[:5])}")
+            logger.warning("Errors for %d tickers: %s", len(errors), "; ".join(errors[:5]))
 
-        print(f"Fetched {len(quotes)} quotes out of {len(tickers)} tickers")
+        logger.info("Fetched %d quotes out of %d tickers", len(quotes), len(tickers))
         return quotes
 
     def fetch_quote_single(self, ticker: str) -> Optional[StockQuote]:
-        """Fetch a single stock quote."""
+        """Fetch a single stock quote (same bar source and cache as fetch_quotes_batch)."""
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period="5d")
-
-            if hist.empty:
-                print(f"  No history for {ticker}")
+            latest, previous = self._fetch_bars([ticker]).get(ticker, (None, None))
+            if latest is None:
+                logger.info("No history for %s", ticker)
                 return None
 
-            latest = hist.iloc[-1]
-            previous = hist.iloc[-2] if len(hist) >= 2 else None
-
-            settings = get_settings()
-            return self._build_quote(ticker, latest, previous, settings)
+            return self._build_quote(ticker, latest, previous, get_settings().tsx_stocks)
         except Exception as e:
-            print(f"  Error fetching {ticker}: {e}")
-            traceback.print_exc()
+            # Stack traces only at DEBUG: throttling makes this path fire repeatedly
+            logger.warning("fetch_quote_single failed for %s: %s", ticker, e,
+                           exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
     def fetch_top_tsx_quotes(self, db: Optional[Session] = None) -> List[StockQuote]:
@@ -129,33 +302,43 @@ class YFinanceStockScraper:
         return self.fetch_quotes_batch(tickers, db=db)
 
     def update_top_100_universe(self, db: Session) -> List[Top100Stock]:
-        """Update the Top 100 TSX stocks table from configured stock list."""
-        print("Updating Top 100 TSX stocks...")
-        settings = get_settings()
+        """
+        Update the Top 100 TSX stocks table from configured stock list.
 
-        results = []
-        for rank, (ticker, name) in enumerate(settings.tsx_stocks.items(), 1):
-            sector = settings.stock_sectors.get(ticker, "Other")
-
-            existing = db.query(Top100Stock).filter(Top100Stock.ticker == ticker).first()
-            if existing:
-                existing.market_cap_rank = rank
-                existing.last_updated = datetime.utcnow()
-                results.append(existing)
-            else:
-                top_stock = Top100Stock(
-                    ticker=ticker,
-                    company_name=name,
-                    exchange="TSX",
-                    sector=sector,
-                    market_cap_rank=rank,
-                    is_active=True,
-                    last_updated=datetime.utcnow(),
-                    selection_criteria="market_cap",
-                )
-                db.add(top_stock)
-                results.append(top_stock)
+        One bulk upsert: new tickers are inserted, existing ones get their rank and
+        last_updated refreshed only when the rank changed.
+        """
+        logger.info("Updating Top 100 TSX stocks...")
+        settings = get_settings()
 
+        now = datetime.utcnow()
+        rows = [
+            dict(
+                ticker=ticker,
+                company_name=name,
+                exchange="TSX",
+                sector=settings.stock_sectors.get(ticker, "Other"),
+                market_cap_rank=rank,
+                is_active=True,
+                last_updated=now,
+                selection_criteria="market_cap",
+            )
+            for rank, (ticker, name) in enumerate(settings.tsx_stocks.items(), 1)
+        ]
+        if rows:
+            stmt = dialect_insert(db, Top100Stock).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["ticker"],
+                set_={
+                    "market_cap_rank": stmt.excluded.market_cap_rank,
+                    "last_updated": stmt.excluded.last_updated,
+                },
+                # Steady-state runs: leave rows whose rank hasn't moved untouched
+                where=Top100Stock.market_cap_rank.is_distinct_from(stmt.excluded.market_cap_rank),
+            )
+            db.execute(stmt)
         db.commit()
-        print(f"Updated {len(results)} stocks in Top 100 universe")
+
+        results = [Top100Stock(**row) for row in rows]
+        logger.info("Updated %d stocks in Top 100 universe", len(results))
         return results
@@ -11,11 +11,14 @@ Run this before a demo to populate the database with real data.
 """
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 # Add parent directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from app.database import init_db, SessionLocal
+from app.logging_config import configure_logging
 from app.services.ingestion import ingest_all_feeds
 from app.agents.pipeline import process_unprocessed_articles
 from app.services.backtest import run_backtest_for_unvalidated
@@ -23,8 +26,78 @@ from app.agents.theme import detect_themes
 from app.models import Article, Theme
 from datetime import datetime, timedelta
 
+from sqlalchemy import Integer, cast, func, select
+
+
+def _count_of(model):
+    return select(func.count()).select_from(model).scalar_subquery()
+
+
+def _avg_of(column):
+    # AVG skips NULLs, so untested horizons don't dilute the accuracy
+    return select(func.avg(cast(column, Integer))).scalar_subquery()
+
+
+def _in_session(step):
+    """Run a seed step with its own DB session (sessions are not thread-safe)."""
+    db = SessionLocal()
+    try:
+        return step(db)
+    finally:
+        db.close()
+
+
+def _detect_and_store_themes(db) -> Optional[int]:
+    """Step 4: detect themes over the last 14 days of processed articles; None if too few articles."""
+    cutoff = datetime.utcnow() - timedelta(days=14)
+    # Plain column rows: the prompt only needs text, not hydrated Article objects
+    articles = db.query(
+        Article.id, Article.title, Article.summary, Article.content, Article.source,
+    ).filter(
+        Article.processed == True,
+        Article.published_at >= cutoff,
+    ).order_by(Article.published_at.desc()).limit(30).all()
+
+    if len(articles) >= 2:
+        article_dicts = [
+            {"title": a.title, "summary": a.summary or a.content, "source": a.source}
+            for a in articles
+        ]
+        raw_themes = detect_themes(article_dicts)
+
+        # Load ORM objects only for the articles the themes actually reference, in one IN query
+        linked_ids = {
+            articles[idx].id
+            for t in raw_themes
+            for idx in t.get("article_indices", [])
+            if 0 <= idx < len(articles)
+        }
+        by_id = {a.id: a for a in db.query(Article).filter(Article.id.in_(linked_ids))} if linked_ids else {}
+
+        now = datetime.utcnow()
+        themes = []
+        for t in raw_themes:
+            theme = Theme(
+                name=t.get("name", "Unknown"),
+                description=t.get("description", ""),
+                sector=t.get("sector", "Cross-sector"),
+                relevance_score=t.get("relevance_score", 0.5),
+                created_at=now,
+            )
+            theme.articles.extend(
+                by_id[articles[idx].id]
+                for idx in t.get("article_indices", [])
+                if 0 <= idx < len(articles)
+            )
+            themes.append(theme)
+        db.add_all(themes)
+        db.commit()
+        return len(raw_themes)
+    return None
+
 
 def main():
+    configure_logging()
     print("=" * 60)
     print("Financial Intelligence Platform - Demo Seed Script")
     print("=" * 60)
@@ -53,63 +126,44 @@ def main():
         print(f"\n  Articles processed: {process_result['articles_processed']}")
         print(f"  Signals generated: {process_result['signals_generated']}")
 
-        # Step 3: Back-test signals
+        # Steps 3 and 4 both only depend on step 2's output (market data vs. Claude calls),
+        # so they run side by side, each with its own session
         print("\n[Step 3] Running back-tests against market data...")
-        bt_result = run_backtest_for_unvalidated(db)
+        print("[Step 4] Detecting investment themes...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            bt_future = executor.submit(_in_session, run_backtest_for_unvalidated)
+            themes_future = executor.submit(_in_session, _detect_and_store_themes)
+            bt_result = bt_future.result()
+            n_detected = themes_future.result()
+
         print(f"\n  Signals tested: {bt_result['signals_tested']}")
         print(f"  Results created: {bt_result['results_created']}")
-
-        # Step 4: Detect themes
-        print("\n[Step 4] Detecting investment themes...")
-        cutoff = datetime.utcnow() - timedelta(days=14)
-        articles = db.query(Article).filter(
-            Article.processed == True,
-            Article.published_at >= cutoff,
-        ).order_by(Article.published_at.desc()).limit(30).all()
-
-        if len(articles) >= 2:
-            article_dicts = [
-                {"title": a.title, "summary": a.summary or a.content, "source": a.source}
-                for a in articles
-            ]
-            raw_themes = detect_themes(article_dicts)
-            for t in raw_themes:
-                theme = Theme(
-                    name=t.get("name", "Unknown"),
-                    description=t.get("description", ""),
-                    sector=t.get("sector", "Cross-sector"),
-                    relevance_score=t.get("relevance_score", 0.5),
-                    created_at=datetime.utcnow(),
-                )
-                indices = t.get("article_indices", [])
-                for idx in indices:
-                    if 0 <= idx < len(articles):
-                        theme.articles.append(articles[idx])
-                db.add(theme)
-            db.commit()
-            print(f"  Themes detected: {len(raw_themes)}")
+        if n_detected is not None:
+            print(f"  Themes detected: {n_detected}")
         else:
             print("  Not enough articles for theme detection")
 
-        # Summary
+        # Summary: all counts and accuracy averages in one round-trip
         from app.models import Signal, BacktestResult
+        summary = db.execute(select(
+            _count_of(Article), _count_of(Signal), _count_of(BacktestResult), _count_of(Theme),
+            _avg_of(BacktestResult.accurate_1d), _avg_of(BacktestResult.accurate_7d),
+        )).one()
+        n_articles, n_signals, n_results, n_themes, acc_1d, acc_7d = summary
+
         print("\n" + "=" * 60)
         print("SEED COMPLETE - Database Summary")
         print("=" * 60)
-        print(f"  Articles: {db.query(Article).count()}")
-        print(f"  Signals: {db.query(Signal).count()}")
-        print(f"  Back-test Results: {db.query(BacktestResult).count()}")
-        print(f"  Themes: {db.query(Theme).count()}")
+        print(f"  Articles: {n_articles}")
+        print(f"  Signals: {n_signals}")
+        print(f"  Back-test Results: {n_results}")
+        print(f"  Themes: {n_themes}")
 
         # Accuracy summary
-        bt_results = db.query(BacktestResult).all()
-        if bt_results:
-            acc_1d = [r.accurate_1d for r in bt_results if r.accurate_1d is not None]
-            acc_7d = [r.accurate_7d for r in bt_results if r.accurate_7d is not None]
-            if acc_1d:
-                print(f"\n  1-Day Accuracy: {sum(acc_1d)/len(acc_1d)*100:.1f}%")
-            if acc_7d:
-                print(f"  7-Day Accuracy: {sum(acc_7d)/len(acc_7d)*100:.1f}%")
+        if acc_1d is not None:
+            print(f"\n  1-Day Accuracy: {acc_1d*100:.1f}%")
+        if acc_7d is not None:
+            print(f"  7-Day Accuracy: {acc_7d*100:.1f}%")
 
         print("\nReady for demo! Start the server with:")
         print("  cd backend && uvicorn app.main:app --reload")
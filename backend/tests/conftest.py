@@ -0,0 +1,30 @@
+import os
+import sys
+import tempfile
+
+# Point the app at a throwaway SQLite file before any app module reads settings
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "test.db")
+
+# Add backend directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from app.database import Base, SessionLocal, engine
+
+
+@pytest.fixture(autouse=True)
+def fresh_db():
+    """Empty schema for every test."""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    yield
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
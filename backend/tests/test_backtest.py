@@ -0,0 +1,111 @@
+import random
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+from app.services.backtest import _nearest_prices
+
+
+def _reference_nearest_price(prices, target_date, max_days_offset=5):
+    """The original scalar find_nearest_price loop, kept verbatim as the behaviour to match."""
+    for offset in range(max_days_offset + 1):
+        for direction in [0, 1, -1, 2, -2, 3, -3, 4, -4, 5, -5]:
+            check_date = (target_date + timedelta(days=direction + offset)).strftime("%Y-%m-%d")
+            if check_date in prices:
+                return prices[check_date]
+        check_date = (target_date + timedelta(days=offset)).strftime("%Y-%m-%d")
+        if check_date in prices:
+            return prices[check_date]
+    return None
+
+
+def _vectorized(prices, targets):
+    keys = sorted(prices)
+    dates = np.array(keys, dtype="datetime64[D]")
+    closes = np.array([prices[k] for k in keys], dtype=np.float64)
+    days = np.array([t.date() for t in targets], dtype="datetime64[D]")
+    return [None if np.isnan(v) else v for v in _nearest_prices(dates, closes, days)]
+
+
+def test_nearest_prices_matches_scalar_probe_on_random_calendars():
+    rng = random.Random(1234)
+    start = date(2024, 1, 1)
+    for _ in range(300):
+        # Sparse, gappy calendars so targets land 0-15 days from the nearest bar
+        prices = {
+            (start + timedelta(days=d)).isoformat(): float(d)
+            for d in sorted(rng.sample(range(60), rng.randint(1, 8)))
+        }
+        targets = [datetime(2024, 1, 1) + timedelta(days=rng.randint(-15, 75)) for _ in range(20)]
+        expected = [_reference_nearest_price(prices, t) for t in targets]
+        assert _vectorized(prices, targets) == expected
+
+
+def test_nearest_prices_reaches_six_to_ten_days_forward():
+    prices = {"2024-01-17": 42.0}
+    assert _vectorized(prices, [datetime(2024, 1, 7), datetime(2024, 1, 11), datetime(2024, 1, 6)]) == [
+        42.0,  # +10 days: forward probe
+        42.0,  # +6 days: forward probe
+        None,  # +11 days: out of reach
+    ]
+    # Backward reach stays at 5 days
+    assert _vectorized(prices, [datetime(2024, 1, 22), datetime(2024, 1, 23)]) == [42.0, None]
+
+
+def _signal_rows(ticker, signals):
+    return [{
+        "signal_id": s.id,
+        "ticker": ticker,
+        "signal_date": s.created_at,
+        # NOT NULL column: a None here makes the whole multi-row INSERT fail
+        "direction_predicted": None if ticker == "BAD.TO" else s.direction,
+        "price_at_signal": 10.0,
+        "created_at": s.created_at,
+    } for s in signals]
+
+
+def test_failed_result_batch_is_rolled_back_and_isolated(monkeypatch, db):
+    from app.models import Article, BacktestResult, Signal
+    from app.services import backtest
+
+    article = Article(title="t", source="s", url="https://x.test/a", url_hash="h")
+    db.add(article)
+    db.flush()
+    for ticker in ("RY.TO", "BAD.TO", "TD.TO"):
+        db.add(Signal(article_id=article.id, stock_ticker=ticker, sentiment="positive",
+                      confidence=0.5, direction="up", created_at=datetime(2024, 1, 2)))
+    db.commit()
+
+    monkeypatch.setattr(backtest, "backtest_ticker_signals", _signal_rows)
+
+    result = backtest.run_backtest_for_unvalidated(db)
+
+    assert result == {"signals_tested": 3, "results_created": 2}
+    # The session is still usable and only the good rows were stored
+    assert sorted(r.ticker for r in db.query(BacktestResult)) == ["RY.TO", "TD.TO"]
+
+
+def test_empty_price_window_is_not_cached(monkeypatch):
+    import pandas as pd
+
+    from app.services import backtest
+
+    frames = [
+        pd.DataFrame({"Close": []}),
+        pd.DataFrame({"Close": [10.0]}, index=pd.to_datetime(["2024-01-02"])),
+    ]
+
+    class _Ticker:
+        def __init__(self, ticker):
+            pass
+
+        def history(self, start, end):
+            return frames.pop(0)
+
+    monkeypatch.setattr(backtest.yf, "Ticker", _Ticker)
+    backtest.clear_price_cache()
+    window = (datetime(2024, 1, 1), datetime(2024, 1, 5))
+
+    assert backtest.get_stock_prices("XYZ.TO", *window) == {}
+    assert backtest.get_stock_prices("XYZ.TO", *window) == {"2024-01-02": 10.0}
+    backtest.clear_price_cache()
@@ -0,0 +1,24 @@
+import threading
+
+from app.services.ingestion_orchestrator import IngestionOrchestrator
+
+
+def test_full_ingestion_runs_stages_sequentially_on_callers_session_for_sqlite(monkeypatch, db):
+    orchestrator = IngestionOrchestrator()
+    calls = []
+
+    def stage(name, result):
+        def run(session, **kwargs):
+            calls.append((name, session, threading.current_thread()))
+            return result
+        return run
+
+    monkeypatch.setattr(orchestrator, "ingest_all_news", stage("news", {"Globe": 2}))
+    monkeypatch.setattr(orchestrator, "update_stock_quotes", stage("quotes", 5))
+    monkeypatch.setattr(orchestrator, "ingest_sentiment", stage("sentiment", 3))
+
+    results = orchestrator.run_full_ingestion(db)
+
+    assert results == {"news": {"Globe": 2}, "stock_quotes": 5, "sentiment_posts": 3}
+    assert [name for name, _, _ in calls] == ["news", "quotes", "sentiment"]
+    assert all(session is db and thread is threading.current_thread() for _, session, thread in calls)
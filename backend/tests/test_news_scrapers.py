@@ -0,0 +1,62 @@
+import httpx
+
+from app.services.scrapers.news_scrapers import GlobeAndMailScraper
+
+
+def _page(title):
+    body = f"<html><body><h1>{title}</h1><div class='article'><p>Body of {title}.</p></div></body></html>"
+    return httpx.Response(200, content=body.encode(), headers={"Content-Type": "text/html; charset=utf-8"})
+
+
+def test_failed_article_fetch_is_topped_up_from_the_listing(monkeypatch):
+    scraper = GlobeAndMailScraper()
+    candidates = [(f"https://www.theglobeandmail.com/article-{i}", f"Listing title number {i}") for i in range(5)]
+    requested = []
+
+    def fake_fetch_many(urls):
+        requested.append(list(urls))
+        # article-1 is paywalled / 403: no body
+        return [None if url.endswith("article-1") else _page(url.rsplit("/", 1)[1]) for url in urls]
+
+    monkeypatch.setattr(scraper, "_fetch_many", fake_fetch_many)
+
+    articles = scraper._build_articles(candidates, 3, ["article"])
+
+    assert [a.url.rsplit("/", 1)[1] for a in articles] == ["article-0", "article-2", "article-3"]
+    # First batch asks for exactly limit pages, the second only for the one that was missing
+    assert [len(batch) for batch in requested] == [3, 1]
+
+
+def test_build_articles_stops_when_listing_runs_out(monkeypatch):
+    scraper = GlobeAndMailScraper()
+    candidates = [("https://www.theglobeandmail.com/article-0", "Listing title number 0")]
+    monkeypatch.setattr(scraper, "_fetch_many", lambda urls: [None for _ in urls])
+
+    assert scraper._build_articles(candidates, 3, ["article"]) == []
+
+
+def test_utf8_page_without_meta_charset_is_decoded_from_the_header(monkeypatch):
+    scraper = GlobeAndMailScraper()
+    body = "<html><body><h1>Café owners cheer</h1><div class='article'><p>Crème brûlée prices.</p></div></body></html>"
+    response = httpx.Response(200, content=body.encode("utf-8"), headers={"Content-Type": "text/html; charset=utf-8"})
+    monkeypatch.setattr(scraper, "_fetch_many", lambda urls: [response for _ in urls])
+
+    [page] = scraper._scrape_generic_articles(["https://www.theglobeandmail.com/article-1"], ["article"])
+
+    assert page["title"] == "Café owners cheer"
+    assert page["content"] == "Crème brûlée prices."
+
+
+def test_parse_lxml_charset_precedence():
+    scraper = GlobeAndMailScraper()
+    page = "<html><head><meta charset='windows-1252'></head><body><h1>Café</h1></body></html>"
+
+    # <meta charset> applies when the header has none
+    tree = scraper._parse_lxml(page.encode("cp1252"), "text/html")
+    assert tree.findtext(".//h1") == "Café"
+    # The header charset wins over <meta>
+    tree = scraper._parse_lxml(page.encode("utf-8"), "text/html; charset=UTF-8")
+    assert tree.findtext(".//h1") == "Café"
+    # Neither: UTF-8, not libxml2's Latin-1 default
+    tree = scraper._parse_lxml("<html><body><h1>Café</h1></body></html>".encode("utf-8"))
+    assert tree.findtext(".//h1") == "Café"
@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+import httpx
+
+from app.services.scrapers import base
+from app.services.scrapers.base import BaseScraper
+
+
+class _Scraper(BaseScraper):
+    source_name = "Test"
+    base_url = "https://news.test"
+    request_delay = 0.0
+    retry_backoff = 0.0
+
+    def scrape(self, *args, **kwargs):
+        return []
+
+
+def _fetch(scraper, handler, urls):
+    async def run():
+        semaphore = asyncio.Semaphore(scraper.fetch_concurrency)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await asyncio.gather(*(scraper._afetch(client, semaphore, url) for url in urls))
+    return asyncio.run(run())
+
+
+def test_afetch_retries_429_honouring_retry_after(monkeypatch):
+    monkeypatch.setattr(base, "_HOST_THROTTLES", {})
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, content=b"<html>ok</html>")
+
+    [response] = _fetch(_Scraper(), handler, ["https://news.test/a"])
+    assert response.content == b"<html>ok</html>"
+    assert len(calls) == 2
+
+
+def test_afetch_gives_up_after_max_retries(monkeypatch):
+    monkeypatch.setattr(base, "_HOST_THROTTLES", {})
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return httpx.Response(503)
+
+    scraper = _Scraper()
+    assert _fetch(scraper, handler, ["https://news.test/a"]) == [None]
+    assert len(calls) == scraper.max_retries + 1
+
+
+def test_afetch_does_not_retry_client_errors(monkeypatch):
+    monkeypatch.setattr(base, "_HOST_THROTTLES", {})
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return httpx.Response(404)
+
+    assert _fetch(_Scraper(), handler, ["https://news.test/a"]) == [None]
+    assert len(calls) == 1
+
+
+def test_afetch_spaces_requests_per_host(monkeypatch):
+    monkeypatch.setattr(base, "_HOST_THROTTLES", {})
+    sent = []
+
+    def handler(request):
+        sent.append(time.monotonic())
+        return httpx.Response(200, content=b"ok")
+
+    scraper = _Scraper()
+    scraper.request_delay = 0.1
+    _fetch(scraper, handler, [f"https://news.test/{i}" for i in range(4)])
+
+    gaps = [b - a for a, b in zip(sent, sent[1:])]
+    assert len(sent) == 4
+    assert min(gaps) >= 0.09
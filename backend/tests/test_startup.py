@@ -0,0 +1,30 @@
+import httpx
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models import StockQuote, Top100Stock
+from app.services.scrapers.stock_scrapers import YFinanceStockScraper
+
+
+BAR = {"Close": 100.0, "Open": 99.0, "High": 101.0, "Low": 98.0, "Volume": 1000}
+
+
+def test_startup_populates_universe_and_quotes_inside_event_loop(monkeypatch, db):
+    """The sync startup hook runs on the event-loop thread; the chart fan-out must still work there."""
+    async def fake_charts(self, tickers):
+        return [(BAR, {**BAR, "Close": 95.0}) for _ in tickers]
+
+    def no_sidecar(*args, **kwargs):
+        raise httpx.ConnectError("offline")
+
+    monkeypatch.setattr(YFinanceStockScraper, "_afetch_charts", fake_charts)
+    monkeypatch.setattr(YFinanceStockScraper, "_bars_cache", {})
+    monkeypatch.setattr("app.services.scheduler.start_scheduler", lambda: None)
+    monkeypatch.setattr("app.services.scheduler.stop_scheduler", lambda: None)
+    monkeypatch.setattr(httpx, "get", no_sidecar)
+
+    with TestClient(app):
+        pass
+
+    assert db.query(Top100Stock).count() > 0
+    assert db.query(StockQuote).count() == db.query(Top100Stock).count()
@@ -0,0 +1,48 @@
+from app.models import StockQuote
+from app.services.scrapers.stock_scrapers import YFinanceStockScraper
+
+
+BAR = {"Close": 100.0, "Open": 99.0, "High": 101.0, "Low": 98.0, "Volume": 1000}
+
+
+def _scraper_with_fake_charts(monkeypatch):
+    calls = []
+
+    async def fake_charts(self, tickers):
+        calls.append(list(tickers))
+        return [(BAR, {**BAR, "Close": 95.0}) for _ in tickers]
+
+    monkeypatch.setattr(YFinanceStockScraper, "_afetch_charts", fake_charts)
+    monkeypatch.setattr(YFinanceStockScraper, "_bars_cache", {})
+    return YFinanceStockScraper(), calls
+
+
+def test_persisting_batches_reuse_recent_bars(monkeypatch, db):
+    scraper, calls = _scraper_with_fake_charts(monkeypatch)
+
+    assert len(scraper.fetch_quotes_batch(["RY.TO", "TD.TO"], db=db)) == 2
+    assert len(scraper.fetch_quotes_batch(["RY.TO", "TD.TO", "BNS.TO"], db=db)) == 3
+
+    # Only the ticker missing from the cache went back to Yahoo; every quote was stored
+    assert calls == [["RY.TO", "TD.TO"], ["BNS.TO"]]
+    assert db.query(StockQuote).count() == 5
+
+
+def test_single_quote_shares_the_bars_cache(monkeypatch):
+    scraper, calls = _scraper_with_fake_charts(monkeypatch)
+
+    scraper.fetch_quotes_batch(["RY.TO"])
+    quote = scraper.fetch_quote_single("RY.TO")
+
+    assert quote.current_price == 100.0
+    assert calls == [["RY.TO"]]
+
+
+def test_expired_bars_are_refetched(monkeypatch):
+    scraper, calls = _scraper_with_fake_charts(monkeypatch)
+    scraper.bars_cache_ttl = 0
+
+    scraper.fetch_quotes_batch(["RY.TO"])
+    scraper.fetch_quotes_batch(["RY.TO"])
+
+    assert calls == [["RY.TO"], ["RY.TO"]]